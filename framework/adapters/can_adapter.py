@@ -5,29 +5,315 @@ Provides interface to CAN bus communication using python-can library.
 Supports SocketCAN, PCAN, Vector, and other interfaces.
 """
 
+import array
+import asyncio
 import can
-from typing import List, Optional, Dict, Any
-from dataclasses import dataclass
+import ctypes
+import ctypes.util
+import errno
+import os
+import queue
+import select
+import socket
+import struct
+import sys
+import threading
+import time
+from typing import List, Optional, Dict, Any, Sequence, Tuple, Union
 from framework.core.types import OperationResult
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Accepted payload types for send paths; lists of ints are still supported
+CANData = Union[bytes, bytearray, memoryview, List[int]]
+
+# Sentinel telling the TX worker thread to exit
+_TX_STOP = object()
+
+# Largest raw SocketCAN frame (struct canfd_frame); classic frames are 16 bytes
+_CANFD_FRAME_SIZE = 72
+
+# SocketCAN can_id flag bits and ID masks (linux/can.h)
+_CAN_EFF_FLAG = 0x80000000
+_CAN_RTR_FLAG = 0x40000000
+_CAN_ERR_FLAG = 0x20000000
+_CAN_EFF_MASK = 0x1FFFFFFF
+_CAN_SFF_MASK = 0x000007FF
+
+# SO_TIMESTAMPNS / SCM_TIMESTAMPNS, enabled on the socket by python-can
+_SO_TIMESTAMPNS = 35
+
+# Linux SO_RCVBUFFORCE (not exported by the socket module); needs CAP_NET_ADMIN
+_SO_RCVBUFFORCE = 33
+
+
+class _IOVec(ctypes.Structure):
+    _fields_ = [("iov_base", ctypes.c_void_p), ("iov_len", ctypes.c_size_t)]
+
+
+class _MsgHdr(ctypes.Structure):
+    _fields_ = [
+        ("msg_name", ctypes.c_void_p),
+        ("msg_namelen", ctypes.c_uint32),
+        ("msg_iov", ctypes.c_void_p),
+        ("msg_iovlen", ctypes.c_size_t),
+        ("msg_control", ctypes.c_void_p),
+        ("msg_controllen", ctypes.c_size_t),
+        ("msg_flags", ctypes.c_int),
+    ]
+
+
+class _MMsgHdr(ctypes.Structure):
+    _fields_ = [("msg_hdr", _MsgHdr), ("msg_len", ctypes.c_uint)]
+
+
+def _cmsg_align(length: int) -> int:
+    align = ctypes.sizeof(ctypes.c_size_t)
+    return (length + align - 1) & ~(align - 1)
+
+
+# cmsghdr header (size_t len, int level, int type) and one struct timespec
+_CMSG_HDR = struct.Struct("@Nii")
+_TIMESPEC = struct.Struct("@ll")
+_CMSG_DATA_OFFSET = _cmsg_align(_CMSG_HDR.size)
+_CMSG_TS_SPACE = _CMSG_DATA_OFFSET + _cmsg_align(_TIMESPEC.size)
+_FRAME_HEAD = struct.Struct("=IB")
+
+
+def _parse_cpu_list(text: str) -> set:
+    """Parse a kernel CPU list such as "0-3,6" into a set of CPU numbers"""
+    cpus = set()
+    for part in text.strip().split(','):
+        if not part:
+            continue
+        first, _, last = part.partition('-')
+        cpus.update(range(int(first), int(last or first) + 1))
+    return cpus
+
+
+def _irq_cpus(channel: str) -> Optional[set]:
+    """CPUs the interrupt of network interface ``channel`` is routed to"""
+    try:
+        with open('/proc/interrupts') as f:
+            for line in f:
+                fields = line.split()
+                if fields and fields[0].endswith(':') and channel in fields[1:]:
+                    irq = fields[0][:-1]
+                    with open(f'/proc/irq/{irq}/smp_affinity_list') as aff:
+                        return _parse_cpu_list(aff.read()) or None
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def _load_recvmmsg():
+    """Return libc recvmmsg() via ctypes, or None where unavailable"""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        recvmmsg = libc.recvmmsg
+    except (OSError, AttributeError):
+        return None
+    recvmmsg.argtypes = [
+        ctypes.c_int, ctypes.c_void_p, ctypes.c_uint, ctypes.c_int, ctypes.c_void_p
+    ]
+    recvmmsg.restype = ctypes.c_int
+    return recvmmsg
+
+
+class _MmsgReceiver:
+    """Preallocated recvmmsg() buffers for batched reads from a SocketCAN socket"""
+
+    def __init__(self, recvmmsg, fd: int, capacity: int):
+        self._recvmmsg = recvmmsg
+        self._fd = fd
+        self.capacity = capacity
+
+        self._frames = ctypes.create_string_buffer(_CANFD_FRAME_SIZE * capacity)
+        self._control = ctypes.create_string_buffer(_CMSG_TS_SPACE * capacity)
+        self._iov = (_IOVec * capacity)()
+        self._hdrs = (_MMsgHdr * capacity)()
+
+        frames_addr = ctypes.addressof(self._frames)
+        control_addr = ctypes.addressof(self._control)
+        for i in range(capacity):
+            self._iov[i].iov_base = frames_addr + i * _CANFD_FRAME_SIZE
+            self._iov[i].iov_len = _CANFD_FRAME_SIZE
+            hdr = self._hdrs[i].msg_hdr
+            hdr.msg_iov = ctypes.addressof(self._iov[i])
+            hdr.msg_iovlen = 1
+            hdr.msg_control = control_addr + i * _CMSG_TS_SPACE
+
+    def recv(self, max_n: int) -> List["CANMessage"]:
+        """
+        Read up to ``max_n`` already-queued frames with a single syscall.
+
+        Remote (RTR) and error frames are dropped: CANMessage has no flag to
+        mark them, and returning them as data frames would misreport their
+        ID and payload.
+        """
+        n = min(max_n, self.capacity)
+        hdrs = self._hdrs
+        for i in range(n):
+            hdrs[i].msg_hdr.msg_controllen = _CMSG_TS_SPACE
+
+        count = self._recvmmsg(self._fd, ctypes.byref(hdrs), n, socket.MSG_DONTWAIT, None)
+        if count < 0:
+            err = ctypes.get_errno()
+            if err in (errno.EAGAIN, errno.EWOULDBLOCK, errno.EINTR):
+                return []
+            raise OSError(err, os.strerror(err))
+
+        frames = memoryview(self._frames)
+        control = memoryview(self._control)
+        unpack_head = _FRAME_HEAD.unpack_from
+        unpack_cmsg = _CMSG_HDR.unpack_from
+        unpack_ts = _TIMESPEC.unpack_from
+        sol_socket = socket.SOL_SOCKET
+        frame_size = _CANFD_FRAME_SIZE
+        cmsg_space = _CMSG_TS_SPACE
+        message_cls = CANMessage
+        received_at = time.time()
+
+        messages = []
+        append = messages.append
+        for i in range(count):
+            mmsg = hdrs[i]
+            offset = i * frame_size
+            can_id, length = unpack_head(frames, offset)
+            if can_id & (_CAN_RTR_FLAG | _CAN_ERR_FLAG):
+                continue
+            is_extended = bool(can_id & _CAN_EFF_FLAG)
+
+            timestamp = received_at
+            if mmsg.msg_hdr.msg_controllen >= cmsg_space:
+                c_offset = i * cmsg_space
+                _, level, c_type = unpack_cmsg(control, c_offset)
+                if level == sol_socket and c_type == _SO_TIMESTAMPNS:
+                    sec, nsec = unpack_ts(control, c_offset + _CMSG_DATA_OFFSET)
+                    timestamp = sec + nsec / 1e9
+
+            append(message_cls(
+                can_id & (_CAN_EFF_MASK if is_extended else _CAN_SFF_MASK),
+                bytearray(frames[offset + 8:offset + 8 + length]),
+                is_extended,
+                mmsg.msg_len == frame_size,
+                timestamp
+            ))
+        return messages
+
+
+def _make_filter(can_id: int, mask: Optional[int] = None) -> Dict[str, Any]:
+    """python-can filter dict; the default mask and ID type follow the ID width"""
+    extended = can_id > _CAN_SFF_MASK
+    if mask is None:
+        mask = _CAN_EFF_MASK if extended else _CAN_SFF_MASK
+    return {"can_id": can_id, "can_mask": mask, "extended": extended}
+
+
+def _encode_filter(f: Dict[str, Any]) -> Tuple[int, int]:
+    """
+    Pack a filter dict into (id, mask) words in the SocketCAN can_filter
+    layout: CAN_EFF_FLAG in the mask when the ID type matters, and in the
+    ID when that type is extended.
+    """
+    can_id = f["can_id"] & _CAN_EFF_MASK
+    mask = f["can_mask"] & _CAN_EFF_MASK
+    if "extended" in f:
+        mask |= _CAN_EFF_FLAG
+        if f["extended"]:
+            can_id |= _CAN_EFF_FLAG
+    return can_id, mask
+
+
+def _decode_filter(can_id: int, mask: int) -> Dict[str, Any]:
+    """Inverse of _encode_filter()"""
+    flt = {"can_id": can_id & _CAN_EFF_MASK, "can_mask": mask & _CAN_EFF_MASK}
+    if mask & _CAN_EFF_FLAG:
+        flt["extended"] = bool(can_id & _CAN_EFF_FLAG)
+    return flt
+
+
+def _merge_filters(a: Dict[str, Any], b: Dict[str, Any]) -> Dict[str, Any]:
+    """Smallest single filter accepting everything either input accepts"""
+    mask = a["can_mask"] & b["can_mask"] & ~(a["can_id"] ^ b["can_id"])
+    merged = {"can_id": a["can_id"] & mask, "can_mask": mask}
+    if "extended" in a and a.get("extended") == b.get("extended"):
+        merged["extended"] = a["extended"]
+    return merged
+
+
+def optimize_filters(filters: List[Dict[str, Any]], max_count: int) -> List[Dict[str, Any]]:
+    """
+    Reduce a filter set to at most ``max_count`` hardware filters.
+
+    Repeatedly merges the pair of filters whose union keeps the most mask
+    bits set, i.e. the merge that lets through the fewest extra IDs. The
+    result accepts a superset of the original frames; exact matching is
+    still up to the consumer.
+
+    Args:
+        filters: python-can filter dicts
+        max_count: Number of available hardware filter slots
+
+    Returns:
+        Merged list of filter dicts
+    """
+    filters = list(filters)
+    while len(filters) > max(max_count, 1):
+        best_rank = -1
+        best = None
+        for i in range(len(filters)):
+            for j in range(i + 1, len(filters)):
+                merged = _merge_filters(filters[i], filters[j])
+                rank = bin(merged["can_mask"]).count("1")
+                if rank > best_rank:
+                    best_rank, best = rank, (i, j, merged)
+        i, j, merged = best
+        filters[i] = merged
+        del filters[j]
+    return filters
+
 
-@dataclass
 class CANMessage:
-    """CAN message data structure"""
-    arbitration_id: int
-    data: List[int]
-    is_extended_id: bool = False
-    is_fd: bool = False
-    timestamp: float = 0.0
-    
+    """
+    CAN message data structure.
+
+    ``data`` holds the payload buffer as received (python-can hands over a
+    bytearray), so no per-byte copy is made on receive. Use ``data_list``
+    when a list of ints is needed.
+    """
+    __slots__ = ('arbitration_id', 'data', 'is_extended_id', 'is_fd', 'timestamp')
+
+    def __init__(self, arbitration_id: int, data: CANData,
+                 is_extended_id: bool = False, is_fd: bool = False,
+                 timestamp: float = 0.0):
+        self.arbitration_id = arbitration_id
+        self.data = data
+        self.is_extended_id = is_extended_id
+        self.is_fd = is_fd
+        self.timestamp = timestamp
+
+    @property
+    def data_list(self) -> List[int]:
+        """Payload as a list of ints (built on demand)"""
+        return list(self.data)
+
     def to_can_message(self) -> can.Message:
-        """Convert to python-can Message"""
+        """
+        Convert to python-can Message.
+
+        python-can keeps a bytearray payload as-is, so messages built by
+        from_can_message() round-trip without copying the payload.
+        """
+        data = self.data
+        if not isinstance(data, bytearray):
+            data = bytearray(data)
         return can.Message(
             arbitration_id=self.arbitration_id,
-            data=self.data,
+            data=data,
             is_extended_id=self.is_extended_id,
             is_fd=self.is_fd
         )
@@ -36,11 +322,31 @@ class CANMessage:
     def from_can_message(cls, msg: can.Message) -> 'CANMessage':
         """Create from python-can Message"""
         return cls(
-            arbitration_id=msg.arbitration_id,
-            data=list(msg.data),
-            is_extended_id=msg.is_extended_id,
-            is_fd=msg.is_fd,
-            timestamp=msg.timestamp
+            msg.arbitration_id,
+            msg.data,
+            msg.is_extended_id,
+            msg.is_fd,
+            msg.timestamp
+        )
+
+    def __eq__(self, other):
+        if not isinstance(other, CANMessage):
+            return NotImplemented
+        return (
+            self.arbitration_id == other.arbitration_id
+            and self.data == other.data
+            and self.is_extended_id == other.is_extended_id
+            and self.is_fd == other.is_fd
+            and self.timestamp == other.timestamp
+        )
+
+    __hash__ = None
+
+    def __repr__(self):
+        return (
+            f"CANMessage(arbitration_id={self.arbitration_id!r}, data={self.data!r}, "
+            f"is_extended_id={self.is_extended_id!r}, is_fd={self.is_fd!r}, "
+            f"timestamp={self.timestamp!r})"
         )
 
 
@@ -64,6 +370,13 @@ class CANAdapter:
         adapter.cleanup()
     """
     
+    __slots__ = (
+        'config', 'bus', '_initialized', '_Message',
+        '_tx_q', '_tx_thread', '_tx_failed', '_tx_failed_reported', '_tx_last_error',
+        '_mmsg', '_flt_ids', '_flt_masks', '_flt_groups',
+        '_rx_pool', '_rx_idx', '_rx_q', '_rx_thread', '_rx_stop', '_get_stats',
+    )
+
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize CAN adapter.
@@ -73,8 +386,40 @@ class CANAdapter:
         """
         self.config = config
         self.bus: Optional[can.BusABC] = None
-        self.filters: List[int] = []
+        # Active filters as parallel (SoA) arrays, see _encode_filter()
+        self._flt_ids = array.array('I')
+        self._flt_masks = array.array('I')
         self._initialized = False
+
+        # Message constructor bound once for the send paths
+        self._Message = can.Message
+
+        # Bus get_stats(), resolved in initialize(); None if unsupported
+        self._get_stats = None
+
+        # Optional paced TX queue (enabled with config 'tx_queue')
+        self._tx_q: Optional[queue.SimpleQueue] = None
+        self._tx_thread: Optional[threading.Thread] = None
+        # Send failures in the TX worker (written by the worker only), how many
+        # of them were already reported to a caller, and the last error text
+        self._tx_failed = 0
+        self._tx_failed_reported = 0
+        self._tx_last_error = ""
+
+        # Batched SocketCAN receive buffers, created on first receive_batch()
+        self._mmsg: Optional[_MmsgReceiver] = None
+
+        # Filters grouped by mask for filter_batch(), rebuilt on change
+        self._flt_groups: Optional[Tuple[Tuple[int, set], ...]] = None
+
+        # Reusable CANMessage slots for receive_message_into_pool()
+        self._rx_pool: Optional[List[CANMessage]] = None
+        self._rx_idx = 0
+
+        # Optional RX worker thread (enabled with config 'rx_thread')
+        self._rx_q: Optional[queue.SimpleQueue] = None
+        self._rx_thread: Optional[threading.Thread] = None
+        self._rx_stop = threading.Event()
     
     def initialize(self) -> OperationResult:
         """
@@ -100,6 +445,19 @@ class CANAdapter:
                 fd=fd
             )
             
+            self._tune_socket()
+            self._get_stats = getattr(self.bus, 'get_stats', None)
+
+            # Re-apply filters added before the bus existed
+            if self._flt_ids:
+                self._push_filters(self.filters)
+
+            if self.config.get('tx_queue', False):
+                self._start_tx_worker()
+
+            if self.config.get('rx_thread', False):
+                self._start_rx_worker()
+
             self._initialized = True
             
             return OperationResult(
@@ -114,14 +472,48 @@ class CANAdapter:
                 error=str(e)
             )
     
-    def send_message(self, arbitration_id: int, data: List[int], 
+    def _tune_socket(self) -> None:
+        """
+        Size the socket buffers of socket-backed buses.
+
+        TCP transports (remote interfaces, gateways) get Nagle disabled.
+        Buffer sizes are only changed when set in config: 'rcvbuf' (bytes)
+        sets SO_RCVBUF on TCP, and on raw SocketCAN SO_RCVBUFFORCE so bursts
+        are not dropped by the kernel, falling back to SO_RCVBUF (capped by
+        net.core.rmem_max) without CAP_NET_ADMIN; 'sndbuf' sets SO_SNDBUF
+        on TCP. Failures are logged and ignored.
+        """
+        sock = getattr(self.bus, 'socket', None)
+        if not isinstance(sock, socket.socket):
+            return
+
+        rcvbuf = self.config.get('rcvbuf')
+        try:
+            if sock.type == socket.SOCK_STREAM:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                if rcvbuf:
+                    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, rcvbuf)
+                sndbuf = self.config.get('sndbuf')
+                if sndbuf:
+                    sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, sndbuf)
+            elif rcvbuf and sock.family == getattr(socket, 'AF_CAN', None):
+                try:
+                    sock.setsockopt(socket.SOL_SOCKET, _SO_RCVBUFFORCE, rcvbuf)
+                except PermissionError:
+                    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, rcvbuf)
+        except OSError as e:
+            logger.warning(f"Could not tune CAN socket buffers: {e}")
+
+    def send_message(self, arbitration_id: int, data: CANData,
                      is_extended: bool = False) -> OperationResult:
         """
         Send CAN message.
         
         Args:
             arbitration_id: CAN message ID
-            data: Message data bytes (0-8 bytes for CAN, 0-64 for CAN-FD)
+            data: Message data bytes (0-8 bytes for CAN, 0-64 for CAN-FD).
+                  A bytearray is used by python-can as-is; other types
+                  are copied once.
             is_extended: Use extended ID format (29-bit)
         
         Returns:
@@ -133,8 +525,19 @@ class CANAdapter:
                 error="CAN interface not initialized"
             )
         
+        if not isinstance(data, (bytes, bytearray)):
+            try:
+                data = bytearray(data)
+            except (TypeError, ValueError) as e:
+                logger.error(f"CAN send failed: invalid payload: {e}")
+                return OperationResult(success=False, error=f"Invalid CAN payload: {e}")
+
+        if self._tx_q is not None:
+            self._tx_q.put((arbitration_id, data, is_extended))
+            return self._queued_result(1, f"Queued CAN message ID 0x{arbitration_id:X}")
+
         try:
-            msg = can.Message(
+            msg = self._Message(
                 arbitration_id=arbitration_id,
                 data=data,
                 is_extended_id=is_extended
@@ -142,7 +545,8 @@ class CANAdapter:
             
             self.bus.send(msg)
             
-            logger.debug(f"CAN TX: ID=0x{arbitration_id:X} Data={[hex(b) for b in data]}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("CAN TX: ID=0x%X Data=%s", arbitration_id, data.hex())
             
             return OperationResult(
                 success=True,
@@ -156,6 +560,177 @@ class CANAdapter:
                 error=str(e)
             )
     
+    def send_messages(self, messages: Sequence[Tuple[int, CANData, bool]]) -> OperationResult:
+        """
+        Send a batch of CAN messages.
+
+        Messages are built and sent in a single tight loop, so per-message
+        overhead (attribute lookups, logging, result objects) is paid once
+        per batch. Buses exposing a native ``send_batch`` get the whole batch
+        in one call.
+
+        Args:
+            messages: Sequence of (arbitration_id, data, is_extended) tuples
+
+        Returns:
+            OperationResult with the number of sent messages in data
+        """
+        if not self._initialized or self.bus is None:
+            return OperationResult(
+                success=False,
+                error="CAN interface not initialized"
+            )
+
+        if self._tx_q is not None:
+            # Normalize the whole batch first so a bad payload queues nothing
+            bytes_types = (bytes, bytearray)
+            try:
+                items = [
+                    (arbitration_id,
+                     data if isinstance(data, bytes_types) else bytearray(data),
+                     is_extended)
+                    for arbitration_id, data, is_extended in messages
+                ]
+            except (TypeError, ValueError) as e:
+                logger.error(f"CAN batch send failed: invalid payload: {e}")
+                return OperationResult(success=False, data=0,
+                                       error=f"Invalid CAN payload: {e}")
+            tx_put = self._tx_q.put
+            for item in items:
+                tx_put(item)
+            return self._queued_result(len(items), f"Queued {len(items)} CAN messages")
+
+        sent = 0
+        try:
+            message_cls = self._Message
+            send_batch = getattr(self.bus, 'send_batch', None)
+            bytes_types = (bytes, bytearray)
+
+            if send_batch is not None:
+                batch = [
+                    message_cls(arbitration_id=arbitration_id,
+                                data=data if isinstance(data, bytes_types) else bytearray(data),
+                                is_extended_id=is_extended)
+                    for arbitration_id, data, is_extended in messages
+                ]
+                send_batch(batch)
+                sent = len(batch)
+            else:
+                bus_send = self.bus.send
+                for arbitration_id, data, is_extended in messages:
+                    if not isinstance(data, bytes_types):
+                        data = bytearray(data)
+                    bus_send(message_cls(arbitration_id=arbitration_id, data=data,
+                                         is_extended_id=is_extended))
+                    sent += 1
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("CAN TX batch: %d messages", sent)
+
+            return OperationResult(
+                success=True,
+                data=sent,
+                log=f"Sent {sent} CAN messages"
+            )
+
+        except Exception as e:
+            logger.error(f"CAN batch send failed after {sent} messages: {e}")
+            return OperationResult(
+                success=False,
+                data=sent,
+                error=str(e)
+            )
+
+    def _start_tx_worker(self) -> None:
+        """Start the background thread that drains the TX queue onto the bus"""
+        self._tx_q = queue.SimpleQueue()
+        self._tx_failed = self._tx_failed_reported = 0
+        self._tx_last_error = ""
+        self._tx_thread = threading.Thread(
+            target=self._tx_loop,
+            name=f"can-tx-{self.config.get('channel', 'unknown')}",
+            daemon=True
+        )
+        self._tx_thread.start()
+
+    def _tx_loop(self) -> None:
+        """
+        TX worker: send up to ``tx_batch_size`` queued messages, then pause
+        for ``tx_batch_delay_ms`` so the controller TX FIFO can drain.
+        """
+        tx_q = self._tx_q
+        bus_send = self.bus.send
+        message_cls = self._Message
+        batch_size = self.config.get('tx_batch_size', 4)
+        batch_delay = self.config.get('tx_batch_delay_ms', 10) / 1000
+
+        while True:
+            item = tx_q.get()
+            in_batch = 0
+            while True:
+                if item is _TX_STOP:
+                    return
+
+                arbitration_id, data, is_extended = item
+                try:
+                    bus_send(message_cls(arbitration_id=arbitration_id, data=data,
+                                         is_extended_id=is_extended))
+                except Exception as e:
+                    logger.error(f"CAN TX worker send failed: {e}")
+                    self._tx_last_error = str(e)
+                    self._tx_failed += 1
+
+                in_batch += 1
+                if in_batch >= batch_size:
+                    break
+                try:
+                    item = tx_q.get_nowait()
+                except queue.Empty:
+                    break
+
+            if batch_delay:
+                time.sleep(batch_delay)
+
+    def _queued_result(self, queued: int, log: str) -> OperationResult:
+        """
+        Result for a queued send. Frames the TX worker failed to send since the
+        previous queued call are reported here, as the send calls themselves
+        returned before the frames went out.
+        """
+        failed = self._tx_failed
+        new_failures = failed - self._tx_failed_reported
+        if new_failures:
+            self._tx_failed_reported = failed
+            return OperationResult(
+                success=False,
+                data=queued,
+                error=f"{new_failures} queued CAN message(s) failed to send: {self._tx_last_error}",
+                log=log
+            )
+        return OperationResult(success=True, data=queued, log=log)
+
+    def get_tx_error_count(self) -> int:
+        """Total number of queued messages the TX worker failed to send"""
+        return self._tx_failed
+
+    def _stop_tx_worker(self) -> bool:
+        """
+        Flush pending messages and stop the TX worker thread.
+
+        Returns:
+            False if the worker did not exit within 'tx_stop_timeout'; its
+            queue is then kept so the still running thread is not broken
+        """
+        if self._tx_thread is not None:
+            self._tx_q.put(_TX_STOP)
+            self._tx_thread.join(timeout=self.config.get('tx_stop_timeout', 5.0))
+            if self._tx_thread.is_alive():
+                logger.error("CAN TX worker did not stop within tx_stop_timeout")
+                return False
+        self._tx_thread = None
+        self._tx_q = None
+        return True
+
     def receive_message(self, timeout: Optional[float] = None) -> Optional[CANMessage]:
         """
         Receive CAN message.
@@ -170,16 +745,20 @@ class CANAdapter:
             logger.error("CAN interface not initialized")
             return None
         
+        if self._rx_q is not None:
+            try:
+                return self._rx_q.get(timeout=timeout)
+            except queue.Empty:
+                return None
+
         try:
             msg = self.bus.recv(timeout=timeout)
             
             if msg is None:
                 return None
             
-            logger.debug(
-                f"CAN RX: ID=0x{msg.arbitration_id:X} "
-                f"Data={[hex(b) for b in msg.data]}"
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("CAN RX: ID=0x%X Data=%s", msg.arbitration_id, msg.data.hex())
             
             return CANMessage.from_can_message(msg)
         
@@ -187,28 +766,305 @@ class CANAdapter:
             logger.error(f"CAN receive failed: {e}")
             return None
     
-    def add_filter(self, can_id: int, mask: int = 0x7FF) -> OperationResult:
+    def receive_message_into_pool(self, timeout: Optional[float] = None) -> Optional[CANMessage]:
+        """
+        Receive CAN message into a reusable, pooled CANMessage.
+
+        Pool entries are recycled round-robin, so the returned object is
+        overwritten after ``rx_pool_size`` (config, default 64) further
+        calls. Copy the fields out if the message must be kept longer.
+
+        Args:
+            timeout: Timeout in seconds. None = blocking, 0 = non-blocking
+
+        Returns:
+            Pooled CANMessage if received, None if timeout or error
+        """
+        if not self._initialized or self.bus is None:
+            logger.error("CAN interface not initialized")
+            return None
+
+        if self._rx_q is not None:
+            # The RX worker already hands over its own CANMessage objects
+            try:
+                return self._rx_q.get(timeout=timeout)
+            except queue.Empty:
+                return None
+
+        try:
+            msg = self.bus.recv(timeout=timeout)
+            if msg is None:
+                return None
+
+            pool = self._rx_pool
+            if pool is None:
+                pool = self._rx_pool = [
+                    CANMessage(0, b'') for _ in range(self.config.get('rx_pool_size', 64))
+                ]
+
+            slot = pool[self._rx_idx]
+            self._rx_idx = (self._rx_idx + 1) % len(pool)
+
+            slot.arbitration_id = msg.arbitration_id
+            slot.data = msg.data
+            slot.is_extended_id = msg.is_extended_id
+            slot.is_fd = msg.is_fd
+            slot.timestamp = msg.timestamp
+            return slot
+
+        except Exception as e:
+            logger.error(f"CAN receive failed: {e}")
+            return None
+
+    def peek_arbitration_id(self, timeout: Optional[float] = None) -> Optional[int]:
+        """
+        Receive CAN message and return only its arbitration ID.
+
+        Skips building a CANMessage for callers (counters, loggers) that
+        never look at the payload. The frame is consumed.
+
+        Args:
+            timeout: Timeout in seconds. None = blocking, 0 = non-blocking
+
+        Returns:
+            Arbitration ID if received, None if timeout or error
+        """
+        if not self._initialized or self.bus is None:
+            logger.error("CAN interface not initialized")
+            return None
+
+        try:
+            if self._rx_q is not None:
+                msg = self._rx_q.get(timeout=timeout)
+            else:
+                msg = self.bus.recv(timeout=timeout)
+            return msg.arbitration_id if msg is not None else None
+        except queue.Empty:
+            return None
+        except Exception as e:
+            logger.error(f"CAN receive failed: {e}")
+            return None
+
+    def receive_ids_batch(self, max_n: int = 64,
+                          timeout: Optional[float] = None) -> array.array:
+        """
+        Receive up to ``max_n`` CAN frames and return only their IDs.
+
+        Waits up to ``timeout`` for the first frame, then drains whatever
+        else is already buffered without blocking.
+
+        Args:
+            max_n: Maximum number of IDs to return
+            timeout: Timeout in seconds for the first frame. None = blocking
+
+        Returns:
+            array.array('I') of arbitration IDs (empty on timeout or error)
+        """
+        ids = array.array('I', bytes(4 * max_n))
+        if not self._initialized or self.bus is None:
+            logger.error("CAN interface not initialized")
+            return ids[:0]
+
+        if self._rx_q is not None:
+            recv = self._rx_q.get
+            empty = queue.Empty
+        else:
+            recv = self.bus.recv
+            empty = ()
+
+        count = 0
+        try:
+            msg = recv(timeout=timeout)
+            while msg is not None:
+                ids[count] = msg.arbitration_id
+                count += 1
+                if count >= max_n:
+                    break
+                msg = recv(timeout=0)
+        except empty:
+            pass
+        except Exception as e:
+            logger.error(f"CAN batch receive failed: {e}")
+
+        return ids[:count]
+
+    def receive_batch(self, max_n: int = 64,
+                      timeout: Optional[float] = None) -> List[CANMessage]:
+        """
+        Receive up to ``max_n`` CAN messages in one call.
+
+        Waits up to ``timeout`` for the first frame, then drains whatever
+        else is already buffered without blocking.
+
+        Args:
+            max_n: Maximum number of messages to return
+            timeout: Timeout in seconds for the first message. None = blocking
+
+        Returns:
+            List of received CANMessage objects (empty on timeout or error)
+        """
+        if not self._initialized or self.bus is None:
+            logger.error("CAN interface not initialized")
+            return []
+
+        if self._rx_q is not None:
+            return self._drain_rx_queue(max_n, timeout)
+
+        try:
+            messages = self._read_batch(max_n, timeout)
+        except Exception as e:
+            logger.error(f"CAN batch receive failed: {e}")
+            return []
+
+        if messages and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("CAN RX batch: %d messages", len(messages))
+
+        return messages
+
+    def _read_batch(self, max_n: int, timeout: Optional[float]) -> List[CANMessage]:
+        """Read up to ``max_n`` frames from the bus (recvmmsg on SocketCAN)"""
+        receiver = self._get_mmsg_receiver()
+        if receiver is not None:
+            ready, _, _ = select.select([receiver._fd], [], [], timeout)
+            return receiver.recv(max_n) if ready else []
+
+        messages: List[CANMessage] = []
+        bus_recv = self.bus.recv
+        from_can_message = CANMessage.from_can_message
+        append = messages.append
+
+        msg = bus_recv(timeout=timeout)
+        while msg is not None:
+            append(from_can_message(msg))
+            if len(messages) >= max_n:
+                break
+            msg = bus_recv(timeout=0)
+
+        return messages
+
+    def _drain_rx_queue(self, max_n: int, timeout: Optional[float]) -> List[CANMessage]:
+        """Take up to ``max_n`` messages collected by the RX worker thread"""
+        rx_q = self._rx_q
+        try:
+            messages = [rx_q.get(timeout=timeout)]
+        except queue.Empty:
+            return []
+
+        while len(messages) < max_n:
+            try:
+                messages.append(rx_q.get_nowait())
+            except queue.Empty:
+                break
+        return messages
+
+    def _start_rx_worker(self) -> None:
+        """Start the background thread that reads frames into the RX queue"""
+        self._rx_q = queue.SimpleQueue()
+        self._rx_stop.clear()
+        self._rx_thread = threading.Thread(
+            target=self._rx_loop,
+            name=f"can-rx-{self.config.get('channel', 'unknown')}",
+            daemon=True
+        )
+        self._rx_thread.start()
+
+    def _pin_rx_thread(self) -> None:
+        """
+        Pin the calling (RX worker) thread to the CPU(s) in config 'rx_cpu'
+        (int or list), or else to the CPUs serving the channel's IRQ.
+        """
+        if not hasattr(os, 'sched_setaffinity'):
+            return
+
+        cpus = self.config.get('rx_cpu')
+        if cpus is None:
+            cpus = _irq_cpus(self.config.get('channel', ''))
+            if cpus is None:
+                return
+        elif isinstance(cpus, int):
+            cpus = {cpus}
+
+        try:
+            os.sched_setaffinity(0, cpus)
+            logger.debug("CAN RX worker pinned to CPUs %s", sorted(cpus))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not pin CAN RX worker to CPUs {cpus}: {e}")
+
+    def _rx_loop(self) -> None:
+        """RX worker: read frames in batches and hand them to the RX queue"""
+        self._pin_rx_thread()
+
+        read_batch = self._read_batch
+        rx_put = self._rx_q.put
+        stop = self._rx_stop
+        batch_size = self.config.get('rx_batch_size', 64)
+        poll_interval = self.config.get('rx_poll_interval', 0.1)
+
+        while not stop.is_set():
+            try:
+                batch = read_batch(batch_size, poll_interval)
+            except Exception as e:
+                if stop.is_set():
+                    break
+                logger.error(f"CAN RX worker receive failed: {e}")
+                stop.wait(poll_interval)
+                continue
+
+            for msg in batch:
+                rx_put(msg)
+
+    def _stop_rx_worker(self) -> bool:
+        """
+        Stop the RX worker thread.
+
+        Returns:
+            False if the worker did not exit within 'rx_stop_timeout'; its
+            queue is then kept so the still running thread is not broken
+        """
+        if self._rx_thread is not None:
+            self._rx_stop.set()
+            self._rx_thread.join(timeout=self.config.get('rx_stop_timeout', 5.0))
+            if self._rx_thread.is_alive():
+                logger.error("CAN RX worker did not stop within rx_stop_timeout")
+                return False
+        self._rx_thread = None
+        self._rx_q = None
+        return True
+
+    def _get_mmsg_receiver(self) -> Optional[_MmsgReceiver]:
+        """recvmmsg() receiver for SocketCAN buses, None for other interfaces"""
+        if self._mmsg is None:
+            sock = getattr(self.bus, 'socket', None)
+            if (not isinstance(sock, socket.socket)
+                    or sock.family != getattr(socket, 'AF_CAN', None)):
+                return None
+            recvmmsg = _load_recvmmsg()
+            if recvmmsg is None:
+                return None
+            self._mmsg = _MmsgReceiver(recvmmsg, sock.fileno(),
+                                       self.config.get('rx_batch_size', 64))
+        return self._mmsg
+
+    def add_filter(self, can_id: int, mask: Optional[int] = None) -> OperationResult:
         """
         Add CAN message filter.
+
+        The filter is appended to the active set and the full set is pushed
+        to the bus, so earlier filters stay in effect. IDs above 0x7FF are
+        treated as extended (29-bit) IDs.
         
         Args:
             can_id: CAN ID to filter
-            mask: Filter mask (default 0x7FF for standard ID)
+            mask: Filter mask (default 0x7FF for standard, 0x1FFFFFFF for extended IDs)
         
         Returns:
             OperationResult with success/failure
         """
         try:
-            filter_config = [
-                {"can_id": can_id, "can_mask": mask}
-            ]
-            
-            if self.bus:
-                self.bus.set_filters(filter_config)
+            flt = _make_filter(can_id, mask)
+            self._push_filters(self.filters + [flt])
             
-            self.filters.append(can_id)
-            
-            logger.info(f"Added CAN filter: ID=0x{can_id:X} Mask=0x{mask:X}")
+            logger.info(f"Added CAN filter: ID=0x{can_id:X} Mask=0x{flt['can_mask']:X}")
             
             return OperationResult(
                 success=True,
@@ -221,6 +1077,80 @@ class CANAdapter:
                 success=False,
                 error=str(e)
             )
+
+    def add_filters(self, filters: Sequence[Tuple[int, Optional[int]]]) -> OperationResult:
+        """
+        Add several CAN message filters with a single bus update.
+
+        Args:
+            filters: Sequence of (can_id, mask) tuples; a mask of None
+                     picks the default for the ID width as in add_filter()
+
+        Returns:
+            OperationResult with success/failure
+        """
+        try:
+            self._push_filters(
+                self.filters + [_make_filter(can_id, mask) for can_id, mask in filters]
+            )
+
+            logger.info(f"Added {len(filters)} CAN filters")
+
+            return OperationResult(
+                success=True,
+                log=f"{len(filters)} filters added"
+            )
+
+        except Exception as e:
+            logger.error(f"Failed to add CAN filters: {e}")
+            return OperationResult(
+                success=False,
+                error=str(e)
+            )
+
+    def set_filters(self, filters: List[Dict[str, Any]],
+                    max_hw: Optional[int] = None) -> OperationResult:
+        """
+        Replace the active filter set.
+
+        Args:
+            filters: python-can filter dicts ({"can_id", "can_mask"[, "extended"]})
+            max_hw: Number of hardware filter slots. When the set is larger,
+                    filters are merged down to this many before being applied.
+                    Defaults to config 'max_hw_filters' (unlimited if unset).
+
+        Returns:
+            OperationResult with success/failure
+        """
+        try:
+            self._push_filters(list(filters), max_hw)
+
+            logger.info(f"Set {len(filters)} CAN filters")
+
+            return OperationResult(success=True)
+
+        except Exception as e:
+            logger.error(f"Failed to set CAN filters: {e}")
+            return OperationResult(
+                success=False,
+                error=str(e)
+            )
+
+    def _push_filters(self, filters: List[Dict[str, Any]],
+                      max_hw: Optional[int] = None) -> None:
+        """Apply the filter set to the bus in one call, then store it"""
+        if self.bus:
+            if max_hw is None:
+                max_hw = self.config.get('max_hw_filters')
+            hw_filters = filters
+            if max_hw and len(filters) > max_hw:
+                hw_filters = optimize_filters(filters, max_hw)
+            self.bus.set_filters(hw_filters or None)
+
+        encoded = [_encode_filter(f) for f in filters]
+        self._flt_ids = array.array('I', [can_id for can_id, _ in encoded])
+        self._flt_masks = array.array('I', [mask for _, mask in encoded])
+        self._flt_groups = None
     
     def clear_filters(self) -> OperationResult:
         """
@@ -233,7 +1163,9 @@ class CANAdapter:
             if self.bus:
                 self.bus.set_filters(None)
             
-            self.filters.clear()
+            del self._flt_ids[:]
+            del self._flt_masks[:]
+            self._flt_groups = None
             logger.info("CAN filters cleared")
             
             return OperationResult(success=True)
@@ -241,9 +1173,51 @@ class CANAdapter:
         except Exception as e:
             return OperationResult(success=False, error=str(e))
     
-    def get_filters(self) -> List[int]:
-        """Get list of active filters"""
-        return self.filters.copy()
+    def filter_batch(self, ids: Sequence[int]) -> List[bool]:
+        """
+        Match a batch of arbitration IDs against the active filter set.
+
+        Filters are grouped by mask, so each ID costs one set lookup per
+        distinct mask rather than one comparison per filter. With no
+        filters set every ID matches, as on the bus.
+
+        Args:
+            ids: Arbitration IDs, e.g. from receive_ids_batch()
+
+        Returns:
+            List of booleans, True where the ID passes a filter
+        """
+        if not self._flt_ids:
+            return [True] * len(ids)
+
+        groups = self._flt_groups
+        if groups is None:
+            by_mask: Dict[int, set] = {}
+            for can_id, mask in zip(self._flt_ids, self._flt_masks):
+                mask &= _CAN_EFF_MASK
+                by_mask.setdefault(mask, set()).add(can_id & mask)
+            groups = self._flt_groups = tuple(by_mask.items())
+
+        if len(groups) == 1:
+            (mask, wanted), = groups
+            return [(can_id & mask) in wanted for can_id in ids]
+
+        return [
+            any((can_id & mask) in wanted for mask, wanted in groups)
+            for can_id in ids
+        ]
+
+    @property
+    def filters(self) -> List[Dict[str, Any]]:
+        """Active filters as python-can filter dicts"""
+        return [_decode_filter(can_id, mask)
+                for can_id, mask in zip(self._flt_ids, self._flt_masks)]
+
+    def get_filters(self) -> List[Tuple[int, int]]:
+        """Get list of active (CAN ID, mask) filters"""
+        eff_mask = _CAN_EFF_MASK
+        return [(can_id & eff_mask, mask & eff_mask)
+                for can_id, mask in zip(self._flt_ids, self._flt_masks)]
     
     def get_status(self) -> str:
         """Get bus status"""
@@ -258,26 +1232,69 @@ class CANAdapter:
     def get_error_count(self) -> int:
         """Get error counter (if supported by interface)"""
         # This is hardware-specific and may not be supported by all interfaces
+        get_stats = self._get_stats
+        if get_stats is None:
+            return 0
         try:
-            if self.bus and hasattr(self.bus, 'get_stats'):
-                stats = self.bus.get_stats()
-                return stats.get('error_count', 0)
+            return get_stats().get('error_count', 0)
         except (AttributeError, RuntimeError, OSError) as e:
             logger.debug(f"Could not get CAN error count: {e}")
-            pass
-        return 0
+            return 0
     
     def flush_rx_buffer(self) -> int:
         """
         Flush receive buffer.
-        
+
+        When the RX worker is running it is stopped first, so it does not
+        read the socket concurrently, and restarted once the flush is done.
+
         Returns:
             Number of messages flushed
         """
         count = 0
-        if self.bus:
-            while self.receive_message(timeout=0) is not None:
+        if not self.bus:
+            return count
+
+        rx_q = self._rx_q
+        restart = self._rx_thread is not None
+        stopped = self._stop_rx_worker() if restart else True
+
+        if rx_q is not None:
+            rx_get = rx_q.get_nowait
+            try:
+                while True:
+                    rx_get()
+                    count += 1
+            except queue.Empty:
+                pass
+
+        if not stopped:
+            # Worker still owns the socket; only its queue was flushed
+            return count
+        try:
+            return count + self._flush_bus()
+        finally:
+            if restart:
+                self._start_rx_worker()
+
+    def _flush_bus(self) -> int:
+        """Discard frames pending on the bus itself; returns the count"""
+        count = 0
+        sock = getattr(self.bus, 'socket', None)
+        if isinstance(sock, socket.socket) and sock.family == getattr(socket, 'AF_CAN', None):
+            # SocketCAN: discard raw frames straight from the kernel queue
+            sock_recv = sock.recv
+            try:
+                while True:
+                    sock_recv(_CANFD_FRAME_SIZE, socket.MSG_DONTWAIT)
+                    count += 1
+            except (BlockingIOError, InterruptedError):
+                pass
+        else:
+            bus_recv = self.bus.recv
+            while bus_recv(0) is not None:
                 count += 1
+
         return count
     
     def cleanup(self) -> OperationResult:
@@ -288,6 +1305,18 @@ class CANAdapter:
             OperationResult with success/failure
         """
         try:
+            tx_stopped = self._stop_tx_worker()
+            rx_stopped = self._stop_rx_worker()
+            if not (tx_stopped and rx_stopped):
+                # A live worker still uses the bus; leave it open
+                return OperationResult(
+                    success=False,
+                    error="CAN worker thread did not stop; bus left open"
+                )
+
+            self._mmsg = None
+            self._get_stats = None
+
             if self.bus:
                 self.bus.shutdown()
                 self.bus = None
@@ -308,3 +1337,96 @@ class CANAdapter:
         status = "ready" if self.is_ready() else "not ready"
         channel = self.config.get('channel', 'unknown')
         return f"CANAdapter({channel}, {status})"
+
+
+class AsyncCANAdapter(CANAdapter):
+    """
+    CAN adapter with an asyncio-native receive path.
+
+    Frames are delivered by a python-can Notifier into an
+    AsyncBufferedReader, so ``await recv()`` suspends in the event loop
+    instead of polling the bus. Do not combine with the 'rx_thread' option;
+    both would read from the same bus.
+
+    Usage:
+        adapter = AsyncCANAdapter(config)
+        adapter.initialize()
+        await adapter.start()
+
+        msg = await adapter.recv(timeout=1.0)
+
+        adapter.cleanup()
+    """
+
+    __slots__ = ('_reader', '_notifier')
+
+    def __init__(self, config: Dict[str, Any]):
+        super().__init__(config)
+        self._reader: Optional[can.AsyncBufferedReader] = None
+        self._notifier: Optional[can.Notifier] = None
+
+    async def start(self) -> OperationResult:
+        """
+        Attach the Notifier to the bus on the running event loop.
+
+        Returns:
+            OperationResult with success/failure
+        """
+        if not self._initialized or self.bus is None:
+            return OperationResult(
+                success=False,
+                error="CAN interface not initialized"
+            )
+
+        if self._rx_thread is not None:
+            return OperationResult(
+                success=False,
+                error="Async receive cannot be used together with rx_thread"
+            )
+
+        if self._notifier is None:
+            self._reader = can.AsyncBufferedReader()
+            self._notifier = can.Notifier(
+                self.bus, [self._reader], loop=asyncio.get_running_loop()
+            )
+
+        return OperationResult(success=True, log="Async CAN receive started")
+
+    async def recv(self, timeout: Optional[float] = None) -> Optional[CANMessage]:
+        """
+        Receive CAN message without blocking the event loop.
+
+        Args:
+            timeout: Timeout in seconds. None = wait indefinitely
+
+        Returns:
+            CANMessage if received, None if timeout or not started
+        """
+        if self._reader is None:
+            result = await self.start()
+            if not result.success:
+                logger.error(f"Async CAN receive unavailable: {result.error}")
+                return None
+
+        try:
+            if timeout is None:
+                msg = await self._reader.get_message()
+            else:
+                msg = await asyncio.wait_for(self._reader.get_message(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+        return CANMessage.from_can_message(msg)
+
+    def cleanup(self) -> OperationResult:
+        """
+        Stop async delivery and clean up the CAN interface.
+
+        Returns:
+            OperationResult with success/failure
+        """
+        if self._notifier is not None:
+            self._notifier.stop()
+            self._notifier = None
+            self._reader = None
+        return super().cleanup()
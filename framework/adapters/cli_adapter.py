@@ -7,17 +7,151 @@ and capturing responses for validation.
 """
 
 import serial
-import paramiko
+import codecs
+import os
 import time
 import re
-import difflib
-from typing import Dict, Any, Optional, List, Union
+import functools
+import hashlib
+import queue
+import selectors
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, Any, Optional, List, Union, Iterator, TYPE_CHECKING
 from framework.core.types import OperationResult
 import logging
 
+# paramiko (and its crypto stack) is imported on first SSH use
+if TYPE_CHECKING:
+    import paramiko
+
 logger = logging.getLogger(__name__)
 
 
+# Exit-status marker appended to commands run on the persistent SSH shell
+_SHELL_DONE_RE = re.compile(rb'__VX_DONE_(\d+)__')
+
+# Whitespace runs collapsed by compare_output(ignore_whitespace=True)
+_WS_RE = re.compile(r'\s+')
+
+# Texts longer than this are normalized without caching
+_NORMALIZE_CACHE_LIMIT = 64 * 1024
+
+
+def _normalize_text(text: str, ignore_whitespace: bool, ignore_case: bool) -> str:
+    """Normalize text for compare_output()"""
+    if ignore_whitespace:
+        text = _WS_RE.sub(' ', text.strip())
+    if ignore_case:
+        text = text.lower()
+    return text
+
+
+# Golden outputs are compared over and over; remember their normalized form
+_normalize_cached = functools.lru_cache(maxsize=1024)(_normalize_text)
+
+
+def _normalize(text: str, ignore_whitespace: bool, ignore_case: bool) -> str:
+    """Normalize text, caching results for texts of moderate size"""
+    if len(text) > _NORMALIZE_CACHE_LIMIT:
+        return _normalize_text(text, ignore_whitespace, ignore_case)
+    return _normalize_cached(text, ignore_whitespace, ignore_case)
+
+# Idle clients for send_ssh_command(), keyed on (host, port, username, auth digest)
+_SSH_POOL: Dict[tuple, queue.LifoQueue] = {}
+_SSH_POOL_LOCK = threading.Lock()
+_SSH_POOL_MAX_IDLE = 8
+_SSH_POOL_IDLE_TIMEOUT = 60.0
+_ssh_reaper: Optional[threading.Thread] = None
+
+
+def _reap_idle_ssh() -> None:
+    """Close pooled SSH clients idle for longer than _SSH_POOL_IDLE_TIMEOUT"""
+    while True:
+        time.sleep(_SSH_POOL_IDLE_TIMEOUT / 2)
+        cutoff = time.monotonic() - _SSH_POOL_IDLE_TIMEOUT
+
+        with _SSH_POOL_LOCK:
+            pools = list(_SSH_POOL.values())
+
+        for idle in pools:
+            keep = []
+            while True:
+                try:
+                    client, last_used = idle.get_nowait()
+                except queue.Empty:
+                    break
+                if last_used < cutoff:
+                    client.close()
+                else:
+                    keep.append((client, last_used))
+
+            # Newest first came out first; put back oldest first
+            for item in reversed(keep):
+                try:
+                    idle.put_nowait(item)
+                except queue.Full:
+                    item[0].close()
+
+
+def _start_ssh_reaper() -> None:
+    """Start the idle-client reaper thread once"""
+    global _ssh_reaper
+    with _SSH_POOL_LOCK:
+        if _ssh_reaper is None:
+            _ssh_reaper = threading.Thread(target=_reap_idle_ssh, name="ssh-pool-reaper",
+                                           daemon=True)
+            _ssh_reaper.start()
+
+
+@contextmanager
+def _borrow_ssh(host: str, port: int, username: str, password: Optional[str],
+                timeout: float) -> Iterator["paramiko.SSHClient"]:
+    """
+    Borrow a connected SSH client from the pool, connecting a new one if
+    no live idle client exists. The client goes back to the pool on normal
+    exit and is closed if the block raises.
+    """
+    digest = hashlib.sha256((password or '').encode('utf-8')).hexdigest()
+    key = (host, port, username, digest)
+    with _SSH_POOL_LOCK:
+        idle = _SSH_POOL.setdefault(key, queue.LifoQueue(maxsize=_SSH_POOL_MAX_IDLE))
+
+    ssh = None
+    while True:
+        try:
+            client, _ = idle.get_nowait()
+        except queue.Empty:
+            break
+        transport = client.get_transport()
+        if transport is not None and transport.is_active():
+            ssh = client
+            break
+        client.close()
+
+    if ssh is None:
+        import paramiko
+
+        ssh = paramiko.SSHClient()
+        ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+        ssh.connect(hostname=host, port=port, username=username, password=password,
+                    timeout=timeout)
+
+    try:
+        yield ssh
+    except BaseException:
+        ssh.close()
+        raise
+
+    try:
+        idle.put_nowait((ssh, time.monotonic()))
+    except queue.Full:
+        ssh.close()
+    _start_ssh_reaper()
+
+
 class CliAdapter:
     """
     CLI interface adapter
@@ -51,16 +185,37 @@ class CliAdapter:
         # CLI behavior configuration
         self.command_timeout = config.get('command_timeout', 10.0)
         self.prompt_pattern = config.get('prompt_pattern', r'[\$#>]\s*$')
+        self._prompt_re = re.compile(self.prompt_pattern)
         self.login_prompt = config.get('login_prompt', 'login:')
         self.password_prompt = config.get('password_prompt', 'Password:')
         self.command_delay = config.get('command_delay', 0.1)
 
+        # Read sizing: max bytes per SSH recv, and for serial an optional short
+        # wait that lets small UART reads coalesce into one larger read
+        self.read_buffer_size = config.get('read_buffer_size', 65536)
+        self.read_coalesce = config.get('read_coalesce_ms', 0) / 1000
+
+        # Upper bounds on discarding stale serial input before a command; past
+        # either one the rest is dropped with reset_input_buffer()
+        self.drain_max_time = config.get('drain_max_ms', 100) / 1000
+        self.drain_max_bytes = config.get('drain_max_bytes', 65536)
+
         # Internal state
         self._is_initialized = False
         self._serial_connection = None
         self._ssh_client = None
         self._ssh_shell = None
+        self._shell_lock = threading.Lock()
         self._last_output = ""
+        # (sysfs path, original value) of a latency timer changed by initialize()
+        self._latency_timer_restore: Optional[tuple] = None
+
+        # Reused UTF-8 decoder for the prompt read loops
+        self._utf8 = codecs.getincrementaldecoder('utf-8')(errors='replace')
+
+        # Readiness selector for the active connection's fd; created when a
+        # selectable connection is opened, closed in cleanup()
+        self._sel: Optional[selectors.BaseSelector] = None
 
     def initialize(self) -> OperationResult:
         """
@@ -101,6 +256,9 @@ class CliAdapter:
             self._serial_connection.reset_input_buffer()
             self._serial_connection.reset_output_buffer()
 
+            self._set_usb_latency_timer()
+            self._watch(self._serial_connection)
+
             self._is_initialized = True
             return OperationResult(
                 success=True,
@@ -115,6 +273,8 @@ class CliAdapter:
     def _initialize_ssh(self) -> OperationResult:
         """Initialize SSH connection"""
         try:
+            import paramiko
+
             self._ssh_client = paramiko.SSHClient()
             # Load system host keys, warn if unknown hosts
             self._ssh_client.load_system_host_keys()
@@ -131,7 +291,9 @@ class CliAdapter:
                     port=self.ssh_port,
                     username=self.ssh_username,
                     key_filename=self.ssh_key_path,
-                    timeout=self.timeout
+                    timeout=self.timeout,
+                    banner_timeout=self.timeout,
+                    auth_timeout=self.timeout
                 )
             elif self.ssh_password:
                 self._ssh_client.connect(
@@ -139,7 +301,9 @@ class CliAdapter:
                     port=self.ssh_port,
                     username=self.ssh_username,
                     password=self.ssh_password,
-                    timeout=self.timeout
+                    timeout=self.timeout,
+                    banner_timeout=self.timeout,
+                    auth_timeout=self.timeout
                 )
             else:
                 raise ValueError("SSH connection requires either ssh_key_path or ssh_password")
@@ -147,10 +311,11 @@ class CliAdapter:
             # Create interactive shell
             self._ssh_shell = self._ssh_client.invoke_shell()
             self._ssh_shell.settimeout(self.timeout)
+            self._watch(self._ssh_shell)
 
-            # Wait for initial prompt
-            time.sleep(1)
-            self._read_until_prompt()
+            # Wait for initial prompt; returns as soon as it arrives. Slow
+            # MOTDs are bounded by 'banner_wait_max' (default: timeout)
+            self._read_ssh_until_prompt(self.config.get('banner_wait_max', self.timeout))
 
             self._is_initialized = True
             return OperationResult(
@@ -171,8 +336,13 @@ class CliAdapter:
             OperationResult: Success/failure with details
         """
         try:
+            if self._sel is not None:
+                self._sel.close()
+                self._sel = None
+
             if self._serial_connection and self._serial_connection.is_open:
                 self._serial_connection.close()
+            self._restore_usb_latency_timer()
 
             if self._ssh_shell:
                 self._ssh_shell.close()
@@ -254,16 +424,17 @@ class CliAdapter:
     def _execute_serial_command(self, command: str, timeout: float) -> OperationResult:
         """Execute command via serial connection"""
         try:
-            # Clear buffer
-            self._serial_connection.reset_input_buffer()
+            # Discard stale input without cutting a frame in flight
+            self._drain_serial_input()
 
             # Send command
             cmd_bytes = (command + '\r\n').encode('utf-8')
             self._serial_connection.write(cmd_bytes)
             self._serial_connection.flush()
 
-            # Wait briefly
-            time.sleep(self.command_delay)
+            # The read loop waits for the prompt; only sleep if a delay is configured
+            if 'command_delay' in self.config:
+                time.sleep(self.command_delay)
 
             # Read response
             output = self._read_serial_until_prompt(timeout)
@@ -285,14 +456,16 @@ class CliAdapter:
     def _execute_ssh_command(self, command: str, timeout: float) -> OperationResult:
         """Execute command via SSH connection"""
         try:
-            # Send command
-            self._ssh_shell.send(command + '\n')
+            # The shell is shared with send_ssh_command(); one command at a time
+            with self._shell_lock:
+                # Send command
+                self._ssh_shell.send(command + '\n')
 
-            # Wait briefly
-            time.sleep(self.command_delay)
+                # Wait briefly
+                time.sleep(self.command_delay)
 
-            # Read response
-            output = self._read_ssh_until_prompt(timeout)
+                # Read response
+                output = self._read_ssh_until_prompt(timeout)
 
             # Store last output
             self._last_output = output
@@ -308,41 +481,229 @@ class CliAdapter:
                 error=f"SSH command execution failed: {str(e)}"
             )
 
-    def _read_serial_until_prompt(self, timeout: float) -> str:
-        """Read from serial until prompt is detected"""
-        output = ""
-        start_time = time.time()
+    def _set_usb_latency_timer(self) -> None:
+        """
+        Set the USB-serial (FTDI) latency timer to config 'latency_timer_ms',
+        if configured and the driver exposes it. The timer is device-wide
+        driver state, so the original value is restored by cleanup().
+        """
+        latency_ms = self.config.get('latency_timer_ms')
+        if latency_ms is None:
+            return
+
+        tty = os.path.basename(os.path.realpath(self.device_path))
+        path = f"/sys/bus/usb-serial/devices/{tty}/latency_timer"
+        if not os.path.exists(path):
+            return
+        try:
+            with open(path, 'r+') as f:
+                original = f.read().strip()
+                f.seek(0)
+                f.write(str(latency_ms))
+            self._latency_timer_restore = (path, original)
+        except OSError as e:
+            logger.debug(f"Could not set latency timer for {tty}: {e}")
+
+    def _restore_usb_latency_timer(self) -> None:
+        """Put back the latency timer value replaced by _set_usb_latency_timer()"""
+        if self._latency_timer_restore is None:
+            return
+        path, original = self._latency_timer_restore
+        self._latency_timer_restore = None
+        try:
+            with open(path, 'w') as f:
+                f.write(original)
+        except OSError as e:
+            logger.debug(f"Could not restore latency timer at {path}: {e}")
 
-        while (time.time() - start_time) < timeout:
-            if self._serial_connection.in_waiting > 0:
-                chunk = self._serial_connection.read(self._serial_connection.in_waiting).decode('utf-8', errors='ignore')
-                output += chunk
+    def _drain_serial_input(self) -> None:
+        """
+        Read and discard input until the line stays quiet for 5 ms.
 
-                # Check for prompt
-                if re.search(self.prompt_pattern, output.split('\n')[-1]):
+        A device that never goes quiet (boot log, periodic console) is bounded
+        by config 'drain_max_ms' / 'drain_max_bytes'; once either is reached
+        the remaining input is dropped with reset_input_buffer().
+        """
+        conn = self._serial_connection
+        deadline = time.monotonic() + self.drain_max_time
+        drained = 0
+        while True:
+            if drained >= self.drain_max_bytes or time.monotonic() >= deadline:
+                conn.reset_input_buffer()
+                break
+            waiting = conn.in_waiting
+            if waiting:
+                drained += len(conn.read(waiting))
+                continue
+            if self._sel is not None:
+                if not self._sel.select(0.005):
                     break
             else:
-                time.sleep(0.1)
+                time.sleep(0.005)
+                if not conn.in_waiting:
+                    break
+
+    def _watch(self, connection) -> None:
+        """Register a connection's fd with the selector, if it exposes one"""
+        try:
+            fd = connection.fileno()
+        except (AttributeError, OSError, ValueError) as e:
+            logger.debug(f"CLI connection not selectable, falling back to polling: {e}")
+            return
+
+        sel = selectors.DefaultSelector()
+        try:
+            sel.register(fd, selectors.EVENT_READ)
+        except (OSError, ValueError, KeyError) as e:
+            sel.close()
+            logger.debug(f"CLI connection not selectable, falling back to polling: {e}")
+            return
+
+        if self._sel is not None:
+            self._sel.close()
+        self._sel = sel
+
+    def _wait_readable(self, timeout: float) -> bool:
+        """
+        Block until the connection has data or ``timeout`` expires.
+
+        Returns:
+            bool: False if the timeout expired without data
+        """
+        if self._sel is not None:
+            return bool(self._sel.select(timeout))
+        # Connection without a usable fd: poll
+        time.sleep(min(timeout, 0.1))
+        return True
+
+    def _read_serial_until_prompt(self, timeout: float) -> str:
+        """Read from serial until prompt is detected"""
+        conn = self._serial_connection
+
+        def read_available() -> bytes:
+            waiting = conn.in_waiting
+            if waiting and self.read_coalesce and waiting < self.read_buffer_size:
+                time.sleep(self.read_coalesce)
+                waiting = conn.in_waiting
+            return conn.read(waiting) if waiting else b""
 
-        return output.strip()
+        return self._read_stream_until_prompt(read_available, timeout)
 
     def _read_ssh_until_prompt(self, timeout: float) -> str:
         """Read from SSH until prompt is detected"""
-        output = ""
-        start_time = time.time()
+        shell = self._ssh_shell
+
+        def read_available() -> Optional[bytes]:
+            if shell.recv_ready():
+                return shell.recv(self.read_buffer_size)
+            # A closed channel stays readable forever; report EOF
+            if shell.closed or shell.eof_received:
+                return None
+            return b""
+
+        return self._read_stream_until_prompt(read_available, timeout)
+
+    def _read_stream_until_prompt(self, read_available, timeout: float) -> str:
+        """
+        Collect output until the prompt shows on the current line.
 
-        while (time.time() - start_time) < timeout:
-            if self._ssh_shell.recv_ready():
-                chunk = self._ssh_shell.recv(4096).decode('utf-8', errors='ignore')
-                output += chunk
+        Args:
+            read_available: Returns pending bytes, b"" if none are waiting,
+                            or None once the stream has reached EOF
+            timeout: Overall read timeout
 
-                # Check for prompt
-                if re.search(self.prompt_pattern, output.split('\n')[-1]):
+        Returns:
+            str: Decoded, stripped output
+        """
+        decoder = self._utf8
+        decoder.reset()
+        parts: List[str] = []
+        line = ""
+        deadline = time.monotonic() + timeout
+
+        while True:
+            raw = read_available()
+            if raw is None:
+                break
+            if raw:
+                # Incremental decode keeps multi-byte characters split across reads
+                text = decoder.decode(raw, False)
+                if not parts:
+                    # Trim leading whitespace as it arrives
+                    text = text.lstrip()
+                if text:
+                    parts.append(text)
+
+                # Check for prompt on the current (last) line only
+                newline = text.rfind('\n')
+                line = text[newline + 1:] if newline >= 0 else line + text
+                if self._prompt_re.search(line):
                     break
-            else:
-                time.sleep(0.1)
+                continue
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not self._wait_readable(remaining):
+                break
+
+        parts.append(decoder.decode(b"", True))
 
-        return output.strip()
+        # Trim trailing whitespace on the last pieces only, not the whole output
+        while parts and not parts[-1].rstrip():
+            parts.pop()
+        if parts:
+            parts[-1] = parts[-1].rstrip()
+            if len(parts) == 1:
+                parts[0] = parts[0].lstrip()
+        return ''.join(parts)
+
+    def _exec_on_shell(self, command: str, timeout: float) -> tuple:
+        """
+        Run a command on the persistent SSH shell and collect its output.
+
+        The command is followed by an echo of a sentinel carrying ``$?``, so
+        completion and exit status are read from the stream itself instead
+        of opening a new exec channel. The sentinel goes on its own line so
+        commands ending in ``&``, ``;`` or a ``# comment`` still reach it.
+
+        Returns:
+            (output, exit_code) tuple
+        """
+        shell = self._ssh_shell
+        shell.send(f"{command}\necho __VX_DONE_$?__\n")
+
+        buffer = bytearray()
+        scan_from = 0
+        deadline = time.monotonic() + timeout
+        try:
+            while True:
+                match = _SHELL_DONE_RE.search(buffer, scan_from)
+                if match:
+                    break
+                # Only rescan enough old bytes to catch a marker split across reads
+                scan_from = max(len(buffer) - 32, 0)
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(f"No completion marker within {timeout}s")
+                shell.settimeout(remaining)
+                chunk = shell.recv(self.read_buffer_size)
+                if not chunk:
+                    raise EOFError("SSH shell closed")
+                buffer += chunk
+
+            # Swallow the prompt printed after the marker
+            tail = buffer[match.end():].decode('utf-8', errors='replace')
+            if not self._prompt_re.search(tail.rsplit('\n', 1)[-1]):
+                self._read_ssh_until_prompt(max(deadline - time.monotonic(), 0))
+        finally:
+            shell.settimeout(self.timeout)
+
+        # Drop the echoed command and sentinel lines (the latter holds the
+        # literal marker text)
+        lines = buffer[:match.start()].decode('utf-8', errors='replace').splitlines()
+        if lines and lines[0].rstrip().endswith(command.strip()):
+            del lines[0]
+        output = '\n'.join(line for line in lines if '__VX_DONE_' not in line).strip()
+        return output, int(match.group(1))
 
     def _read_until_prompt(self) -> str:
         """Read until prompt (for initialization)"""
@@ -357,6 +718,16 @@ class CliAdapter:
         """
         Execute command via one-shot SSH connection
 
+        Commands run over exec channels on connections pooled per (host, port,
+        user, password), so repeated calls reuse an authenticated session instead of
+        reconnecting. Each command gets a fresh environment and separate stderr.
+
+        With config 'ssh_reuse_shell' set, commands for the configured SSH host
+        and user run on the adapter's persistent interactive shell instead.
+        That skips opening a channel, but the working directory and environment
+        persist between calls and stderr is merged into 'output' ('error' is
+        always empty).
+
         Args:
             command: Command to execute
             host: SSH host (uses config default if None)
@@ -374,20 +745,22 @@ class CliAdapter:
             password = password or self.ssh_password
             timeout = timeout or self.command_timeout
 
-            # Create temporary SSH client
-            ssh = paramiko.SSHClient()
-            ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-
-            # Connect and execute
-            ssh.connect(hostname=host, username=username, password=password, timeout=timeout)
-            stdin, stdout, stderr = ssh.exec_command(command, timeout=timeout)
-
-            # Get output
-            output = stdout.read().decode('utf-8')
-            error = stderr.read().decode('utf-8')
-            exit_code = stdout.channel.recv_exit_status()
+            if self._ssh_shell is not None and self.config.get('ssh_reuse_shell', False) \
+                    and host == self.ssh_host and username == self.ssh_username:
+                # Reuse the already open interactive shell
+                with self._shell_lock:
+                    output, exit_code = self._exec_on_shell(command, timeout)
+                error = ""
+            else:
+                # Execute over a pooled connection; other hosts use the SSH default port
+                port = self.ssh_port if host == self.ssh_host else 22
+                with _borrow_ssh(host, port, username, password, timeout) as ssh:
+                    stdin, stdout, stderr = ssh.exec_command(command, timeout=timeout)
 
-            ssh.close()
+                    # Get output
+                    output = stdout.read().decode('utf-8')
+                    error = stderr.read().decode('utf-8')
+                    exit_code = stdout.channel.recv_exit_status()
 
             # Store last output
             self._last_output = output
@@ -408,6 +781,28 @@ class CliAdapter:
                 error=f"SSH command failed: {str(e)}"
             )
 
+    def send_ssh_commands_parallel(self, jobs: List[Dict[str, Any]]) -> List[OperationResult]:
+        """
+        Execute several one-shot SSH commands concurrently
+
+        Each job is a dict of send_ssh_command() keyword arguments, e.g.
+        ``{'command': 'uptime', 'host': '10.0.0.2'}``. Up to config
+        'ssh_parallelism' (default 16) jobs run at once; jobs for the same
+        host share pooled connections.
+
+        Args:
+            jobs: List of send_ssh_command() keyword-argument dicts
+
+        Returns:
+            List[OperationResult]: One result per job, in submission order
+        """
+        if not jobs:
+            return []
+
+        workers = min(self.config.get('ssh_parallelism', 16), len(jobs))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="cli-ssh") as executor:
+            return list(executor.map(lambda job: self.send_ssh_command(**job), jobs))
+
     def capture_output(self, timeout: float = None) -> OperationResult:
         """
         Capture current output from the CLI without sending a command
@@ -473,31 +868,40 @@ class CliAdapter:
                     error="No actual output available for comparison"
                 )
 
-            # Normalize strings if requested
-            exp_normalized = expected
-            act_normalized = actual
-
-            if ignore_whitespace:
-                exp_normalized = re.sub(r'\s+', ' ', exp_normalized.strip())
-                act_normalized = re.sub(r'\s+', ' ', act_normalized.strip())
-
-            if ignore_case:
-                exp_normalized = exp_normalized.lower()
-                act_normalized = act_normalized.lower()
+            if expected == actual:
+                # Identical inputs normalize identically; do it once
+                exp_normalized = act_normalized = _normalize(expected, ignore_whitespace,
+                                                             ignore_case)
+                match = True
+            else:
+                # Normalize strings if requested
+                exp_normalized = _normalize(expected, ignore_whitespace, ignore_case)
+                act_normalized = _normalize(actual, ignore_whitespace, ignore_case)
 
-            # Compare
-            match = exp_normalized == act_normalized
+                # Compare
+                match = exp_normalized == act_normalized
 
             # Generate diff if not matching
             diff = ""
             if not match:
+                import difflib
+
+                # Cap the diffed lines; difflib is quadratic in the worst case
+                max_lines = self.config.get('diff_max_lines', 200)
+                expected_lines = expected.splitlines(keepends=True)
+                actual_lines = actual.splitlines(keepends=True)
+                truncated = len(expected_lines) > max_lines or len(actual_lines) > max_lines
+
                 diff_lines = list(difflib.unified_diff(
-                    expected.splitlines(keepends=True),
-                    actual.splitlines(keepends=True),
+                    expected_lines[:max_lines],
+                    actual_lines[:max_lines],
                     fromfile='expected',
-                    tofile='actual'
+                    tofile='actual',
+                    n=3
                 ))
                 diff = ''.join(diff_lines)
+                if truncated:
+                    diff += f"\n... diff limited to the first {max_lines} lines\n"
 
             return OperationResult(
                 success=match,
@@ -549,7 +953,8 @@ class MockCliAdapter(CliAdapter):
     def __init__(self, config):
         super().__init__(config)
         self._mock_responses = {}
-        self._command_history = []
+        # Bounded so long fuzz/soak sessions don't grow without limit
+        self._command_history = deque(maxlen=config.get('history_max', 10000))
 
     def initialize(self) -> OperationResult:
         """Mock initialization - always succeeds"""
@@ -572,9 +977,8 @@ class MockCliAdapter(CliAdapter):
         self._command_history.append(command)
 
         # Generate mock response
-        if command in self._mock_responses:
-            output = self._mock_responses[command]
-        else:
+        output = self._mock_responses.get(command)
+        if output is None:
             output = f"Mock response for: {command}\nCommand executed successfully.\n$ "
 
         self._last_output = output
@@ -608,8 +1012,8 @@ class MockCliAdapter(CliAdapter):
         self._mock_responses[command] = response
 
     def get_command_history(self) -> List[str]:
-        """Get list of executed commands"""
-        return self._command_history.copy()
+        """Get list of executed commands (the most recent 'history_max')"""
+        return list(self._command_history)
 
     def clear_history(self):
         """Clear command history"""
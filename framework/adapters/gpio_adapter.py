@@ -18,7 +18,12 @@ class GPIOAdapter:
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self._initialized = False
-        self._pin_states: Dict[int, bool] = {}
+        # Dense per-pin storage: state (0/1) and whether the pin was ever set.
+        # Valid pins are 0..pin_count-1, widened to cover configured pins.
+        pins = config.get('pins', {}).values()
+        self._pin_count = max(config.get('pin_count', 64), max(pins, default=-1) + 1)
+        self._pin_states = bytearray(self._pin_count)
+        self._pin_valid = bytearray(self._pin_count)
     
     def initialize(self) -> OperationResult:
         """Initialize GPIO"""
@@ -35,19 +40,59 @@ class GPIOAdapter:
         """Set GPIO pin state"""
         if not self._initialized:
             return OperationResult(success=False, error="Not initialized")
+        if not 0 <= pin < self._pin_count:
+            return OperationResult(success=False, error=f"Invalid GPIO pin: {pin}")
         try:
             # Platform-specific pin control here
-            self._pin_states[pin] = value
-            logger.debug(f"GPIO pin {pin} = {value}")
+            self._pin_states[pin] = 1 if value else 0
+            self._pin_valid[pin] = 1
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("GPIO pin %d = %s", pin, value)
             return OperationResult(success=True)
         except Exception as e:
             return OperationResult(success=False, error=str(e))
     
+    def set_pins(self, updates: Dict[int, bool]) -> OperationResult:
+        """
+        Set several GPIO pins in one call.
+
+        Validates all pins first, so either every pin is written or none is.
+        Platform backends can apply the whole batch with one bulk request.
+
+        Args:
+            updates: Mapping of pin number to state
+
+        Returns:
+            OperationResult with the number of pins written in data
+        """
+        if not self._initialized:
+            return OperationResult(success=False, error="Not initialized")
+
+        pin_count = self._pin_count
+        bad = [pin for pin in updates if not 0 <= pin < pin_count]
+        if bad:
+            return OperationResult(success=False, error=f"Invalid GPIO pins: {bad}")
+
+        try:
+            # Platform-specific bulk pin control here
+            states = self._pin_states
+            valid = self._pin_valid
+            for pin, value in updates.items():
+                states[pin] = 1 if value else 0
+                valid[pin] = 1
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("GPIO pins set: %d", len(updates))
+            return OperationResult(success=True, data=len(updates))
+        except Exception as e:
+            return OperationResult(success=False, error=str(e))
+
     def get_pin(self, pin: int) -> Optional[bool]:
         """Get GPIO pin state"""
-        if not self._initialized:
+        if not self._initialized or not 0 <= pin < self._pin_count:
+            return None
+        if not self._pin_valid[pin]:
             return None
-        return self._pin_states.get(pin)
+        return bool(self._pin_states[pin])
     
     def toggle_pin(self, pin: int) -> OperationResult:
         """Toggle GPIO pin"""
@@ -60,7 +105,8 @@ class GPIOAdapter:
         """Cleanup GPIO"""
         try:
             self._initialized = False
-            self._pin_states.clear()
+            self._pin_states[:] = bytes(self._pin_count)
+            self._pin_valid[:] = bytes(self._pin_count)
             logger.info("GPIO cleaned up")
             return OperationResult(success=True)
         except Exception as e:
@@ -5,15 +5,27 @@ Simulated hardware adapters for testing without actual hardware.
 Perfect for CI/CD pipelines and development.
 """
 
-from typing import List, Optional, Dict, Any
+from collections import deque
+from typing import Deque, List, Optional, Dict, Any, Sequence, Tuple
 from framework.core.types import OperationResult
-from framework.adapters.can_adapter import CANMessage
+from framework.adapters.can_adapter import CANMessage, CANData
 import logging
 import time
 import random
 
 logger = logging.getLogger(__name__)
 
+# Arbitration IDs of the periodic frames simulated by MockCANAdapter
+_MOCK_IDS = (0x100, 0x200, 0x300)
+
+# Bound once so the simulated TX/RX paths skip the module attribute lookups
+_time = time.time
+_random = random.random
+_randbytes = random.randbytes
+
+# Translation table for the simulated response payload (each byte + 1, wrapping)
+_INCREMENT = bytes(range(1, 256)) + b'\x00'
+
 
 class MockCANAdapter:
     """
@@ -21,26 +33,34 @@ class MockCANAdapter:
     
     Provides same interface as real CAN adapter but with simulated responses.
     """
+
+    __slots__ = ('config', 'filters', '_initialized', '_message_queue',
+                 '_response_cache',
+                 '_response_cache_size', '_error_count', '_send_count', '_recv_count')
     
     def __init__(self, config: Dict[str, Any]):
         self.config = config
-        self.filters: List[int] = []
+        # Immutable; rebuilt on change so get_filters() can hand it out as-is
+        self.filters: Tuple[Tuple[int, int], ...] = ()
         self._initialized = False
-        self._message_queue: List[CANMessage] = []
+        self._message_queue: Deque[CANMessage] = deque()
+        # TX payload -> simulated response payload, for repeated identical frames
+        self._response_cache: Dict[bytes, bytes] = {}
+        self._response_cache_size = config.get('response_cache_size', 256)
         self._error_count = 0
         self._send_count = 0
         self._recv_count = 0
     
     def initialize(self) -> OperationResult:
         """Initialize mock CAN interface"""
-        logger.info(f"Mock CAN initialized: {self.config.get('channel', 'vcan0')}")
+        logger.info("Mock CAN initialized: %s", self.config.get('channel', 'vcan0'))
         self._initialized = True
         return OperationResult(
             success=True,
             log="Mock CAN interface initialized"
         )
     
-    def send_message(self, arbitration_id: int, data: List[int],
+    def send_message(self, arbitration_id: int, data: CANData,
                      is_extended: bool = False) -> OperationResult:
         """Simulate sending CAN message"""
         if not self._initialized:
@@ -49,22 +69,54 @@ class MockCANAdapter:
                 error="Mock CAN not initialized"
             )
         
+        try:
+            payload = bytes(data)
+        except (TypeError, ValueError) as e:
+            logger.error(f"Mock CAN send failed: invalid payload: {e}")
+            return OperationResult(success=False, error=f"Invalid CAN payload: {e}")
+
         self._send_count += 1
-        logger.debug(
-            f"Mock CAN TX: ID=0x{arbitration_id:X} Data={[hex(b) for b in data]}"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Mock CAN TX: ID=0x%X Data=%s", arbitration_id, payload.hex())
         
         # Simulate response message (echo with modified data)
         response = CANMessage(
             arbitration_id=arbitration_id + 0x08,  # Response ID
-            data=[d + 1 for d in data],  # Increment data
+            data=bytearray(self._response_payload(payload)),  # Incremented data
             is_extended_id=is_extended,
-            timestamp=time.time()
+            timestamp=_time()
         )
         self._message_queue.append(response)
         
         return OperationResult(success=True, log=f"Mock sent ID 0x{arbitration_id:X}")
     
+    def _response_payload(self, key: bytes) -> bytes:
+        """Return the simulated response payload (data incremented), memoized"""
+        cache = self._response_cache
+        payload = cache.get(key)
+        if payload is None:
+            if len(cache) >= self._response_cache_size:
+                cache.clear()
+            payload = cache[key] = key.translate(_INCREMENT)
+        return payload
+
+    def send_messages(self, messages: Sequence[Tuple[int, CANData, bool]]) -> OperationResult:
+        """Simulate sending a batch of CAN messages"""
+        if not self._initialized:
+            return OperationResult(
+                success=False,
+                error="Mock CAN not initialized"
+            )
+
+        sent = 0
+        for arbitration_id, data, is_extended in messages:
+            result = self.send_message(arbitration_id, data, is_extended)
+            if not result.success:
+                return OperationResult(success=False, data=sent, error=result.error)
+            sent += 1
+
+        return OperationResult(success=True, data=sent, log=f"Mock sent {sent} messages")
+
     def receive_message(self, timeout: Optional[float] = None) -> Optional[CANMessage]:
         """Simulate receiving CAN message"""
         if not self._initialized:
@@ -72,9 +124,10 @@ class MockCANAdapter:
         
         # Return queued messages first
         if self._message_queue:
-            msg = self._message_queue.pop(0)
+            msg = self._message_queue.popleft()
             self._recv_count += 1
-            logger.debug(f"Mock CAN RX: ID=0x{msg.arbitration_id:X}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Mock CAN RX: ID=0x%X", msg.arbitration_id)
             return msg
         
         # Simulate no message available
@@ -87,29 +140,55 @@ class MockCANAdapter:
             
             # Generate random message
             msg = CANMessage(
-                arbitration_id=random.choice([0x100, 0x200, 0x300]),
-                data=[random.randint(0, 255) for _ in range(8)],
-                timestamp=time.time()
+                arbitration_id=_MOCK_IDS[int(_random() * len(_MOCK_IDS))],
+                data=_randbytes(8),
+                timestamp=_time()
             )
             self._recv_count += 1
             return msg
         
         return None
     
-    def add_filter(self, can_id: int, mask: int = 0x7FF) -> OperationResult:
+    def receive_batch(self, max_n: int = 64,
+                      timeout: Optional[float] = None) -> List[CANMessage]:
+        """Simulate receiving a batch of CAN messages from the queue"""
+        if not self._initialized:
+            return []
+
+        queue = self._message_queue
+        popleft = queue.popleft
+        messages = []
+        append = messages.append
+        for _ in range(min(max_n, len(queue))):
+            append(popleft())
+        self._recv_count += len(messages)
+        return messages
+
+    def add_filter(self, can_id: int, mask: Optional[int] = None) -> OperationResult:
         """Add mock filter"""
-        self.filters.append(can_id)
-        logger.info(f"Mock CAN filter added: 0x{can_id:X}")
+        if mask is None:
+            mask = 0x1FFFFFFF if can_id > 0x7FF else 0x7FF
+        self.filters += ((can_id, mask),)
+        logger.info("Mock CAN filter added: 0x%X", can_id)
         return OperationResult(success=True)
     
+    def add_filters(self, filters: Sequence[Tuple[int, Optional[int]]]) -> OperationResult:
+        """Add several mock filters"""
+        self.filters += tuple(
+            (can_id, 0x1FFFFFFF if can_id > 0x7FF else 0x7FF) if mask is None else (can_id, mask)
+            for can_id, mask in filters
+        )
+        logger.info("Mock CAN filters added: %d", len(filters))
+        return OperationResult(success=True)
+
     def clear_filters(self) -> OperationResult:
         """Clear mock filters"""
-        self.filters.clear()
+        self.filters = ()
         return OperationResult(success=True)
     
-    def get_filters(self) -> List[int]:
-        """Get active filters"""
-        return self.filters.copy()
+    def get_filters(self) -> Tuple[Tuple[int, int], ...]:
+        """Get active filters (read-only snapshot, no copy)"""
+        return self.filters
     
     def get_status(self) -> str:
         """Get mock status"""
@@ -146,6 +225,8 @@ class MockCANAdapter:
 
 class MockSerialAdapter:
     """Mock serial/UART adapter"""
+
+    __slots__ = ('config', '_initialized', '_read_buffer')
     
     def __init__(self, config: Dict[str, Any]):
         self.config = config
@@ -154,7 +235,7 @@ class MockSerialAdapter:
     
     def initialize(self) -> OperationResult:
         """Initialize mock serial"""
-        logger.info(f"Mock Serial initialized: {self.config.get('port', 'mock')}")
+        logger.info("Mock Serial initialized: %s", self.config.get('port', 'mock'))
         self._initialized = True
         return OperationResult(success=True, log="Mock serial initialized")
     
@@ -163,7 +244,8 @@ class MockSerialAdapter:
         if not self._initialized:
             return OperationResult(success=False, error="Not initialized")
         
-        logger.debug(f"Mock Serial TX: {data.hex()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Mock Serial TX: %s", data.hex())
         
         # Echo data back to read buffer
         self._read_buffer += data
@@ -178,7 +260,8 @@ class MockSerialAdapter:
         if len(self._read_buffer) >= size:
             data = self._read_buffer[:size]
             self._read_buffer = self._read_buffer[size:]
-            logger.debug(f"Mock Serial RX: {data.hex()}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Mock Serial RX: %s", data.hex())
             return data
         
         return b""
@@ -212,11 +295,17 @@ class MockSerialAdapter:
 
 class MockGPIOAdapter:
     """Mock GPIO adapter"""
+
+    __slots__ = ('config', '_initialized', '_pin_states')
     
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self._initialized = False
-        self._pin_states: Dict[int, bool] = {}
+        # Dense pin table indexed by pin number (0/1); like GPIOAdapter,
+        # valid pins are 0..pin_count-1 (widened to cover configured pins)
+        pins = config.get('pins', {}).values()
+        size = max(config.get('pin_count', 64), max(pins, default=-1) + 1)
+        self._pin_states = bytearray(size)
     
     def initialize(self) -> OperationResult:
         """Initialize mock GPIO"""
@@ -224,8 +313,7 @@ class MockGPIOAdapter:
         self._initialized = True
         
         # Initialize all pins to False
-        for pin_name, pin_num in self.config.get('pins', {}).items():
-            self._pin_states[pin_num] = False
+        self._pin_states[:] = bytes(len(self._pin_states))
         
         return OperationResult(success=True, log="Mock GPIO initialized")
     
@@ -233,28 +321,56 @@ class MockGPIOAdapter:
         """Set mock pin state"""
         if not self._initialized:
             return OperationResult(success=False, error="Not initialized")
+        if not 0 <= pin < len(self._pin_states):
+            return OperationResult(success=False, error=f"Invalid GPIO pin: {pin}")
         
-        self._pin_states[pin] = value
-        logger.debug(f"Mock GPIO: Pin {pin} = {value}")
+        self._pin_states[pin] = 1 if value else 0
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Mock GPIO: Pin %d = %s", pin, value)
         
         return OperationResult(success=True)
     
+    def set_pins(self, updates: Dict[int, bool]) -> OperationResult:
+        """Set several mock pin states"""
+        if not self._initialized:
+            return OperationResult(success=False, error="Not initialized")
+        if not updates:
+            return OperationResult(success=True, data=0)
+        states = self._pin_states
+        pin_count = len(states)
+        bad = [pin for pin in updates if not 0 <= pin < pin_count]
+        if bad:
+            return OperationResult(success=False, error=f"Invalid GPIO pins: {bad}")
+
+        for pin, value in updates.items():
+            states[pin] = 1 if value else 0
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Mock GPIO: %d pins set", len(updates))
+
+        return OperationResult(success=True, data=len(updates))
+
     def get_pin(self, pin: int) -> Optional[bool]:
         """Get mock pin state"""
         if not self._initialized:
             return None
         
-        return self._pin_states.get(pin, False)
+        states = self._pin_states
+        return bool(states[pin]) if 0 <= pin < len(states) else False
     
     def toggle_pin(self, pin: int) -> OperationResult:
         """Toggle mock pin"""
-        current = self.get_pin(pin)
-        return self.set_pin(pin, not current)
+        if not self._initialized:
+            return OperationResult(success=False, error="Not initialized")
+        if not 0 <= pin < len(self._pin_states):
+            return OperationResult(success=False, error=f"Invalid GPIO pin: {pin}")
+
+        self._pin_states[pin] ^= 1
+        return OperationResult(success=True)
     
     def cleanup(self) -> OperationResult:
         """Cleanup mock GPIO"""
         self._initialized = False
-        self._pin_states.clear()
+        self._pin_states[:] = bytes(len(self._pin_states))
         logger.info("Mock GPIO cleaned up")
         return OperationResult(success=True)
     
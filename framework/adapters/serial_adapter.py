@@ -4,25 +4,33 @@ Serial/UART Adapter
 Provides interface to serial communication using pyserial.
 """
 
-import serial
-from typing import Optional, Dict, Any
+from typing import TYPE_CHECKING, Optional, Dict, Any
 from framework.core.types import OperationResult
 import logging
 
+if TYPE_CHECKING:
+    import serial
+
 logger = logging.getLogger(__name__)
 
 
 class SerialAdapter:
     """Serial/UART communication adapter"""
+
+    __slots__ = ('config', 'port', '_initialized', '_rx_buf')
     
     def __init__(self, config: Dict[str, Any]):
         self.config = config
-        self.port: Optional[serial.Serial] = None
+        self.port: Optional["serial.Serial"] = None
         self._initialized = False
+        # Reusable receive buffer for read_into()
+        self._rx_buf = bytearray(config.get('rx_buffer_size', 4096))
     
     def initialize(self) -> OperationResult:
         """Initialize serial port"""
         try:
+            # Imported here so mock-only runs never load pyserial
+            import serial
             self.port = serial.Serial(
                 port=self.config['port'],
                 baudrate=self.config.get('baudrate', 115200),
@@ -58,6 +66,32 @@ class SerialAdapter:
             logger.error(f"Serial read failed: {e}")
             return None
     
+    def read_into(self, size: int) -> Optional[memoryview]:
+        """
+        Read up to ``size`` bytes into the adapter's reusable buffer.
+
+        Avoids allocating a new bytes object per read. The returned view
+        is only valid until the next read_into() call; copy it with
+        bytes() if it must be kept.
+
+        Args:
+            size: Maximum number of bytes to read
+
+        Returns:
+            memoryview over the bytes actually read, or None on error
+        """
+        if not self._initialized or not self.port:
+            return None
+        try:
+            if size > len(self._rx_buf):
+                self._rx_buf = bytearray(size)
+            view = memoryview(self._rx_buf)
+            count = self.port.readinto(view[:size]) or 0
+            return view[:count]
+        except Exception as e:
+            logger.error(f"Serial read failed: {e}")
+            return None
+
     def read_line(self, timeout: Optional[float] = None) -> Optional[str]:
         """Read line from serial port"""
         if not self._initialized or not self.port:
@@ -66,7 +100,7 @@ class SerialAdapter:
             if timeout:
                 self.port.timeout = timeout
             line = self.port.readline()
-            return line.decode('utf-8', errors='ignore').strip()
+            return line.strip().decode('utf-8', errors='ignore')
         except Exception as e:
             logger.error(f"Serial readline failed: {e}")
             return None
@@ -4,8 +4,18 @@ SPI Adapter
 SPI (Serial Peripheral Interface) adapter for communication with SPI devices.
 """
 
+from collections import deque
+from typing import List, Union
 from framework.core.types import OperationResult
 
+# Accepted SPI payload types; responses are always bytes
+SpiData = Union[bytes, bytearray, memoryview, List[int]]
+
+
+# Byte translation tables for the simulated transfers (applied in C by bytes.translate)
+_INCREMENT = bytes((b + 1) & 0xFF for b in range(256))
+_INVERT = bytes(0xFF - b for b in range(256))
+
 
 class SpiAdapter:
     """
@@ -14,6 +24,9 @@ class SpiAdapter:
     Handles communication with SPI devices.
     """
 
+    __slots__ = ('config', 'device_path', 'speed', 'mode',
+                 '_is_initialized', '_device_handle', '_status_str')
+
     def __init__(self, config):
         self.config = config
         self.device_path = config.get('device_path', '/dev/spidev0.0')
@@ -23,6 +36,7 @@ class SpiAdapter:
         # Initialize internal state
         self._is_initialized = False
         self._device_handle = None
+        self._status_str = "inactive"  # Kept in step with initialize()/cleanup()
 
     def initialize(self) -> OperationResult:
         """
@@ -42,6 +56,7 @@ class SpiAdapter:
             # For template - simulate successful initialization
             self._device_handle = "mock_spi_handle"
             self._is_initialized = True
+            self._status_str = "active"
             return OperationResult(
                 success=True,
                 log=f"SPI initialized on {self.device_path} at {self.speed} Hz"
@@ -66,6 +81,7 @@ class SpiAdapter:
 
             self._device_handle = None
             self._is_initialized = False
+            self._status_str = "inactive"
             return OperationResult(
                 success=True,
                 log="SPI cleaned up successfully"
@@ -93,23 +109,20 @@ class SpiAdapter:
         Returns:
             str: Status description
         """
-        if self.is_ready():
-            return "active"
-        else:
-            return "inactive"
+        return self._status_str
 
     # TODO: Add your custom methods below
     # Example methods:
 
-    def transfer(self, data: list) -> OperationResult:
+    def transfer(self, data: SpiData) -> OperationResult:
         """
         Transfer data via SPI interface (full duplex)
 
         Args:
-            data: List of bytes to send
+            data: Bytes to send (bytes, bytearray, memoryview or list of ints)
 
         Returns:
-            OperationResult: Success/failure with response data
+            OperationResult: Success/failure with response bytes
         """
         if not self.is_ready():
             return OperationResult(
@@ -118,11 +131,11 @@ class SpiAdapter:
             )
 
         try:
-            # For real hardware:
-            # response = self._device_handle.xfer2(data)
+            # For real hardware (xfer2 takes any int sequence, returns a list):
+            # response = bytes(self._device_handle.xfer2(bytes(data)))
 
             # For template - echo back with modification
-            response = [b + 1 for b in data]  # Increment each byte
+            response = bytes(data).translate(_INCREMENT)  # Increment each byte
 
             return OperationResult(
                 success=True,
@@ -203,26 +216,29 @@ class MockSpiAdapter(SpiAdapter):
     Mock SPI adapter for testing without hardware
     """
 
+    __slots__ = ('_mock_data_queue',)
+
     def __init__(self, config):
         super().__init__(config)
-        self._mock_data_queue = []
+        self._mock_data_queue = deque()
 
     def initialize(self) -> OperationResult:
         """Mock initialization - always succeeds"""
         self._is_initialized = True
         self._device_handle = "mock_spi_handle"
+        self._status_str = "active"
         return OperationResult(
             success=True,
             log=f"Mock SPI initialized on {self.device_path}"
         )
 
-    def transfer(self, data: list) -> OperationResult:
+    def transfer(self, data: SpiData) -> OperationResult:
         """Mock SPI transfer - returns modified data"""
         if not self.is_ready():
             return OperationResult(success=False, error="Not initialized")
 
         # Mock behavior: invert the bytes
-        response = [0xFF - b for b in data]
+        response = bytes(data).translate(_INVERT)
 
         return OperationResult(
             success=True,
@@ -5,15 +5,34 @@ Loads and validates hardware configuration files.
 Provides a centralized way to access test configuration.
 """
 
+import functools
+import logging
 import os
+import pickle
 import yaml
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from pydantic import BaseModel, Field, ConfigDict
 
+try:
+    from yaml import CSafeLoader as _SafeLoader  # libyaml-backed parser
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
 
-class PlatformConfig(BaseModel):
-    """Platform metadata"""
+logger = logging.getLogger(__name__)
+
+# Resolved once at import; ConfigLoader() defaults to <project_root>/config
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+_DEFAULT_CONFIG_DIR = _PROJECT_ROOT / "config"
+
+# Bump when the config model classes change shape; invalidates pickled configs
+_CACHE_VERSION = 2
+
+
+@dataclass(frozen=True, slots=True)
+class PlatformConfig:
+    """Platform metadata (validated by pydantic as a HardwareConfig field)"""
     name: str
     version: str
     vendor: str
@@ -45,8 +64,9 @@ class SerialConfig(InterfaceConfig):
     stopbits: int = 1
 
 
-class TestParameters(BaseModel):
-    """Test execution parameters"""
+@dataclass(frozen=True, slots=True)
+class TestParameters:
+    """Test execution parameters (unknown YAML keys are ignored)"""
     default_timeout: float = 5.0
     long_timeout: float = 30.0
     retry_count: int = 3
@@ -88,14 +108,15 @@ class ConfigLoader:
                        Defaults to <project_root>/config
         """
         if config_dir is None:
-            # Determine config directory relative to this file
-            project_root = Path(__file__).parent.parent.parent
-            config_dir = project_root / "config"
+            config_dir = _DEFAULT_CONFIG_DIR
         
         self.config_dir = Path(config_dir)
         self.hardware_dir = self.config_dir / "hardware"
+        self.cache_dir = self.config_dir / ".cache"
         self._current_config: Optional[HardwareConfig] = None
         self._platform_name: Optional[str] = None
+        # (hardware_dir mtime_ns, platform names) from the last directory scan
+        self._platforms_cache: Optional[Tuple[int, List[str]]] = None
     
     def load_hardware_config(self, platform_name: Optional[str] = None) -> HardwareConfig:
         """
@@ -119,19 +140,60 @@ class ConfigLoader:
         
         self._platform_name = platform_name
         
-        # Build config file path
-        config_file = self.hardware_dir / f"{platform_name}.yaml"
-        
-        if not config_file.exists():
+        # Identical (config_dir, platform, file stat) requests reuse one
+        # validated config; editing the YAML changes the key. Each caller
+        # gets its own copy so mutating it cannot leak into other loaders.
+        src_key = self._source_key(self.hardware_dir / f"{platform_name}.yaml")
+        cached = _load_cached(str(self.config_dir), platform_name, src_key)
+        self._current_config = cached.model_copy(deep=True)
+        return self._current_config
+
+    def _source_key(self, config_file: Path) -> tuple:
+        """
+        Identify the current contents of a platform config file.
+
+        Args:
+            config_file: Path of the platform YAML file
+
+        Returns:
+            (cache version, mtime_ns, size) of the file
+
+        Raises:
+            FileNotFoundError: If configuration file doesn't exist
+        """
+        try:
+            src_stat = config_file.stat()
+        except FileNotFoundError:
             raise FileNotFoundError(
                 f"Hardware configuration not found: {config_file}\n"
                 f"Available configurations: {self.list_available_platforms()}"
             )
+        return (_CACHE_VERSION, src_stat.st_mtime_ns, src_stat.st_size)
+
+    def _load_uncached(self, platform_name: str) -> HardwareConfig:
+        """
+        Read and validate a platform configuration, bypassing the in-process cache.
+
+        Args:
+            platform_name: Name of the platform (without .yaml extension)
+
+        Returns:
+            HardwareConfig object with validated configuration
+        """
+        # Build config file path
+        config_file = self.hardware_dir / f"{platform_name}.yaml"
+        src_key = self._source_key(config_file)
+
+        # Reuse the validated config from a previous run if the YAML is unchanged
+        cache_file = self.cache_dir / f"{platform_name}.pkl"
+        cached = self._read_cache(cache_file, src_key)
+        if cached is not None:
+            return cached
         
         # Load YAML file
         try:
             with open(config_file, 'r') as f:
-                config_data = yaml.safe_load(f)
+                config_data = yaml.load(f.read(), Loader=_SafeLoader)
         except yaml.YAMLError as e:
             raise ValueError(f"Invalid YAML syntax in {config_file}: {e}")
         except IOError as e:
@@ -142,10 +204,60 @@ class ConfigLoader:
 
         # Validate and create config object
         try:
-            self._current_config = HardwareConfig(**config_data)
-            return self._current_config
+            config = HardwareConfig(**config_data)
         except Exception as e:
             raise ValueError(f"Invalid configuration in {config_file}: {e}")
+
+        self._write_cache(cache_file, src_key, config)
+        return config
+
+    @staticmethod
+    def invalidate_cache() -> None:
+        """Forget configs loaded in this process (e.g. after editing them on disk)."""
+        _load_cached.cache_clear()
+
+    def _read_cache(self, cache_file: Path, src_key: tuple) -> Optional[HardwareConfig]:
+        """
+        Load a cached HardwareConfig if it was built from the same source file.
+
+        Args:
+            cache_file: Path of the pickle cache entry
+            src_key: (cache version, mtime_ns, size) of the YAML source
+
+        Returns:
+            Cached HardwareConfig, or None on a miss or unreadable entry
+        """
+        try:
+            with open(cache_file, 'rb') as f:
+                key, config = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable config cache {cache_file}: {e}")
+            return None
+
+        if key != src_key or not isinstance(config, HardwareConfig):
+            return None
+        return config
+
+    def _write_cache(self, cache_file: Path, src_key: tuple, config: HardwareConfig) -> None:
+        """
+        Store a validated HardwareConfig next to the configs (best effort).
+
+        Args:
+            cache_file: Path of the pickle cache entry
+            src_key: (cache version, mtime_ns, size) of the YAML source
+            config: Validated configuration to cache
+        """
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+            with open(tmp_file, 'wb') as f:
+                pickle.dump((src_key, config), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, cache_file)
+        except (OSError, pickle.PicklingError) as e:
+            # Read-only checkouts simply run without the cache
+            logger.debug(f"Could not write config cache {cache_file}: {e}")
     
     def get_current_config(self) -> HardwareConfig:
         """
@@ -212,11 +324,20 @@ class ConfigLoader:
         Returns:
             List of platform names (without .yaml extension)
         """
-        if not self.hardware_dir.exists():
+        try:
+            dir_mtime = os.stat(self.hardware_dir).st_mtime_ns
+        except OSError:
             return []
-        
-        yaml_files = self.hardware_dir.glob("*.yaml")
-        return [f.stem for f in yaml_files]
+
+        # Adding or removing a file bumps the directory mtime
+        cache = self._platforms_cache
+        if cache is None or cache[0] != dir_mtime:
+            with os.scandir(self.hardware_dir) as entries:
+                platforms = [entry.name[:-5] for entry in entries
+                             if entry.name.endswith('.yaml')]
+            cache = self._platforms_cache = (dir_mtime, platforms)
+
+        return list(cache[1])
     
     def get_platform_name(self) -> str:
         """Get name of currently loaded platform."""
@@ -230,6 +351,17 @@ class ConfigLoader:
         return "mock" in config.platform.name.lower()
 
 
+@functools.lru_cache(maxsize=16)
+def _load_cached(config_dir: str, platform_name: str, src_key: tuple) -> HardwareConfig:
+    """
+    Load a platform config once per (config_dir, platform, source stat).
+
+    ``src_key`` is part of the cache key, so an edited YAML file is
+    reloaded. The returned instance is shared; callers hand out copies.
+    """
+    return ConfigLoader(Path(config_dir))._load_uncached(platform_name)
+
+
 # Global singleton instance
 _config_loader = None
 
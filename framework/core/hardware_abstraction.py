@@ -8,9 +8,15 @@ Supports auto-discovery of adapters - any *_adapter.py in framework/adapters/
 can be accessed via hardware.{name}_interface automatically.
 """
 
+import functools
 import importlib
 import logging
-from typing import Optional, Dict, Any, TYPE_CHECKING
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from importlib.util import find_spec
+from pathlib import Path
+from typing import FrozenSet, Optional, Dict, Any, Tuple, Type, TYPE_CHECKING
 
 from framework.core.config_loader import ConfigLoader, HardwareConfig
 from framework.core.types import OperationResult
@@ -23,6 +29,103 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+_ADAPTERS_DIR = Path(__file__).parent.parent / "adapters"
+
+
+@functools.lru_cache(maxsize=1)
+def _discover_adapter_files() -> FrozenSet[str]:
+    """
+    Scan framework/adapters/ once for *_adapter.py modules.
+
+    Call ``_discover_adapter_files.cache_clear()`` to rescan.
+
+    Returns:
+        Adapter names (file name without the '_adapter.py' suffix)
+    """
+    suffix = "_adapter.py"
+    try:
+        with os.scandir(_ADAPTERS_DIR) as entries:
+            return frozenset(
+                entry.name[:-len(suffix)]
+                for entry in entries
+                if entry.name.endswith(suffix) and entry.name != "base_adapter.py"
+                and entry.is_file()
+            )
+    except FileNotFoundError:
+        return frozenset()
+
+
+@functools.lru_cache(maxsize=None)
+def _adapter_available(adapter_name: str) -> bool:
+    """
+    Check whether an adapter module exists, without executing it.
+
+    Args:
+        adapter_name: Name of the adapter
+
+    Returns:
+        True if framework.adapters.{adapter_name}_adapter can be imported
+    """
+    if adapter_name in _discover_adapter_files():
+        return True
+    # Not a plain file in adapters/ (e.g. a package); resolve the spec only
+    try:
+        return find_spec(f'framework.adapters.{adapter_name}_adapter') is not None
+    except (ImportError, ValueError):
+        return False
+
+
+# Built-in adapter classes, imported on first use (keeps python-can/pyserial
+# off the import path of mock-only runs) and then served from the cache
+@functools.lru_cache(maxsize=None)
+def _can_classes() -> Tuple[Type, Type]:
+    from framework.adapters.can_adapter import CANAdapter
+    from framework.adapters.mock_adapter import MockCANAdapter
+    return CANAdapter, MockCANAdapter
+
+
+@functools.lru_cache(maxsize=None)
+def _serial_classes() -> Tuple[Type, Type]:
+    from framework.adapters.serial_adapter import SerialAdapter
+    from framework.adapters.mock_adapter import MockSerialAdapter
+    return SerialAdapter, MockSerialAdapter
+
+
+@functools.lru_cache(maxsize=None)
+def _gpio_classes() -> Tuple[Type, Type]:
+    from framework.adapters.gpio_adapter import GPIOAdapter
+    from framework.adapters.mock_adapter import MockGPIOAdapter
+    return GPIOAdapter, MockGPIOAdapter
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_adapter_class(adapter_name: str) -> Tuple[Type, Optional[Type]]:
+    """
+    Import an adapter module once and return its adapter classes.
+
+    Args:
+        adapter_name: Name of the adapter (e.g., 'ethernet', 'spi')
+
+    Returns:
+        (AdapterClass, MockAdapterClass or None)
+
+    Raises:
+        ImportError: If the adapter module cannot be imported
+        AttributeError: If the module lacks the adapter class
+    """
+    module_name = f'framework.adapters.{adapter_name}_adapter'
+    modules = sys.modules
+    module = modules.get(module_name)
+    if module is None:
+        module = importlib.import_module(module_name)
+
+    # Get the adapter class (e.g., EthernetAdapter) and its optional mock
+    adapter_class_name = f'{adapter_name.title()}Adapter'
+    adapter_class = getattr(module, adapter_class_name)
+    mock_class = getattr(module, f'Mock{adapter_class_name}', None)
+    return adapter_class, mock_class
+
+
 class HardwareAbstractionLayer:
     """
     Main hardware abstraction layer class.
@@ -45,6 +148,9 @@ class HardwareAbstractionLayer:
         # Control GPIO
         hal.gpio.set_pin(17, True)
     """
+
+    __slots__ = ('config_loader', 'config', '_interface_set', '_interface_names',
+                 '_can', '_serial', '_gpio', '_dynamic_adapters', '_initialized')
     
     def __init__(self, config_loader: Optional[ConfigLoader] = None, platform: Optional[str] = None):
         """
@@ -57,6 +163,10 @@ class HardwareAbstractionLayer:
         self.config_loader = config_loader or ConfigLoader()
         self.config: HardwareConfig = self.config_loader.load_hardware_config(platform)
 
+        # Configured interface names, fixed for the lifetime of the HAL
+        self._interface_set = frozenset(self.config.interfaces)
+        self._interface_names = tuple(self.config.interfaces)
+
         # Interface adapters (legacy - keeping for backward compatibility)
         self._can = None
         self._serial = None
@@ -100,8 +210,7 @@ class HardwareAbstractionLayer:
     
     def _initialize_can(self):
         """Initialize CAN interface"""
-        from framework.adapters.can_adapter import CANAdapter
-        from framework.adapters.mock_adapter import MockCANAdapter
+        CANAdapter, MockCANAdapter = _can_classes()
 
         can_config = self.config.interfaces['can']
 
@@ -117,8 +226,7 @@ class HardwareAbstractionLayer:
     
     def _initialize_serial(self):
         """Initialize serial interface"""
-        from framework.adapters.serial_adapter import SerialAdapter
-        from framework.adapters.mock_adapter import MockSerialAdapter
+        SerialAdapter, MockSerialAdapter = _serial_classes()
 
         serial_config = self.config.interfaces['serial']
 
@@ -133,8 +241,7 @@ class HardwareAbstractionLayer:
     
     def _initialize_gpio(self):
         """Initialize GPIO interface"""
-        from framework.adapters.gpio_adapter import GPIOAdapter
-        from framework.adapters.mock_adapter import MockGPIOAdapter
+        GPIOAdapter, MockGPIOAdapter = _gpio_classes()
 
         gpio_config = self.config.interfaces['gpio']
 
@@ -175,12 +282,31 @@ class HardwareAbstractionLayer:
         Supports accessing adapters via {adapter_name}_interface pattern.
         Example: hardware.ethernet_interface automatically loads EthernetAdapter
         """
-        if name.endswith('_interface'):
-            adapter_name = name[:-10]  # Remove '_interface' suffix
-            return self._get_or_create_adapter(adapter_name)
+        adapter_name = name.removesuffix('_interface')
+        if adapter_name is not name:  # Suffix was present and stripped
+            adapter = self._get_or_create_adapter(adapter_name)
+            # Later accesses (on any HAL) go through a property, not __getattr__
+            type(self)._install_interface_descriptors((adapter_name,))
+            return adapter
 
         raise AttributeError(f"'{self.__class__.__name__}' has no attribute '{name}'")
 
+    @classmethod
+    def _install_interface_descriptors(cls, adapter_names) -> None:
+        """
+        Install {adapter_name}_interface properties on the class.
+
+        Args:
+            adapter_names: Adapter names to expose as properties
+        """
+        for adapter_name in adapter_names:
+            attr = f'{adapter_name}_interface'
+            if attr not in cls.__dict__:
+                setattr(cls, attr, property(
+                    lambda self, _name=adapter_name: self._get_or_create_adapter(_name),
+                    doc=f"Get {adapter_name} interface adapter (auto-discovered)"
+                ))
+
     def _get_or_create_adapter(self, adapter_name: str):
         """
         Dynamically load and cache adapter by name.
@@ -195,28 +321,24 @@ class HardwareAbstractionLayer:
             RuntimeError: If adapter cannot be loaded or configured
         """
         # Check cache first
-        if adapter_name in self._dynamic_adapters:
-            return self._dynamic_adapters[adapter_name]
+        adapter_instance = self._dynamic_adapters.get(adapter_name)
+        if adapter_instance is not None:
+            return adapter_instance
 
-        try:
-            # Try to import the adapter module
-            module_name = f'framework.adapters.{adapter_name}_adapter'
-            module = importlib.import_module(module_name)
+        # Interned so the cache key and later lookups compare by identity
+        adapter_name = sys.intern(adapter_name)
 
-            # Get the adapter class (e.g., EthernetAdapter)
-            adapter_class_name = f'{adapter_name.title()}Adapter'
-            adapter_class = getattr(module, adapter_class_name)
+        try:
+            # Import is done once per process; later HALs reuse the classes
+            adapter_class, mock_class = _resolve_adapter_class(adapter_name)
 
             # Get configuration for this adapter
             adapter_config = self.config.interfaces.get(adapter_name, {})
 
             # Check if we should use mock adapter
-            if adapter_config.get('type') == 'mock':
-                # Try to get mock version
-                mock_class_name = f'Mock{adapter_class_name}'
-                if hasattr(module, mock_class_name):
-                    adapter_class = getattr(module, mock_class_name)
-                    logger.debug(f"Using mock adapter for {adapter_name}")
+            if mock_class is not None and adapter_config.get('type') == 'mock':
+                adapter_class = mock_class
+                logger.debug("Using mock adapter for %s", adapter_name)
 
             # Create adapter instance
             adapter_instance = adapter_class(adapter_config)
@@ -224,7 +346,7 @@ class HardwareAbstractionLayer:
             # Cache the adapter
             self._dynamic_adapters[adapter_name] = adapter_instance
 
-            logger.debug(f"Dynamically loaded adapter: {adapter_name}")
+            logger.debug("Dynamically loaded adapter: %s", adapter_name)
             return adapter_instance
 
         except ImportError as e:
@@ -234,6 +356,7 @@ class HardwareAbstractionLayer:
                 f"with {adapter_name.title()}Adapter class. Error: {e}"
             )
         except AttributeError as e:
+            adapter_class_name = f'{adapter_name.title()}Adapter'
             raise RuntimeError(
                 f"Adapter class '{adapter_class_name}' not found in module. "
                 f"Make sure {adapter_name}_adapter.py contains class {adapter_class_name}. "
@@ -251,24 +374,8 @@ class HardwareAbstractionLayer:
         Returns:
             List of adapter names
         """
-        import os
-        from pathlib import Path
-
-        available = []
-
-        # Add configured interfaces
-        available.extend(self.config.interfaces.keys())
-
-        # Discover available adapter files
-        adapters_dir = Path(__file__).parent.parent / "adapters"
-        if adapters_dir.exists():
-            for file in adapters_dir.glob("*_adapter.py"):
-                if file.name != "base_adapter.py" and file.name != "__init__.py":
-                    adapter_name = file.name.replace("_adapter.py", "")
-                    if adapter_name not in available:
-                        available.append(adapter_name)
-
-        return sorted(available)
+        # Configured interfaces plus discoverable adapter files
+        return sorted(set(self.config.interfaces) | _discover_adapter_files())
 
     def get_adapter_info(self, adapter_name: str) -> Dict[str, Any]:
         """
@@ -284,18 +391,11 @@ class HardwareAbstractionLayer:
             'name': adapter_name,
             'configured': adapter_name in self.config.interfaces,
             'loaded': adapter_name in self._dynamic_adapters,
-            'available': False,
+            # Adapter module exists (resolved without importing it)
+            'available': _adapter_available(adapter_name),
             'config': self.config.interfaces.get(adapter_name, {})
         }
 
-        # Check if adapter file exists
-        try:
-            module_name = f'framework.adapters.{adapter_name}_adapter'
-            importlib.import_module(module_name)
-            info['available'] = True
-        except ImportError:
-            info['available'] = False
-
         return info
     
     def cleanup(self) -> OperationResult:
@@ -306,34 +406,22 @@ class HardwareAbstractionLayer:
         Returns:
             OperationResult indicating success/failure
         """
-        errors = []
-
         try:
-            # Clean up legacy adapters
-            if self._can:
-                result = self._can.cleanup()
-                if not result.success:
-                    errors.append(f"CAN cleanup: {result.error}")
-
-            if self._serial:
-                result = self._serial.cleanup()
-                if not result.success:
-                    errors.append(f"Serial cleanup: {result.error}")
-
-            if self._gpio:
-                result = self._gpio.cleanup()
-                if not result.success:
-                    errors.append(f"GPIO cleanup: {result.error}")
-
-            # Clean up dynamic adapters
-            for adapter_name, adapter in self._dynamic_adapters.items():
-                try:
-                    if hasattr(adapter, 'cleanup'):
-                        result = adapter.cleanup()
-                        if not result.success:
-                            errors.append(f"{adapter_name} cleanup: {result.error}")
-                except Exception as e:
-                    errors.append(f"{adapter_name} cleanup error: {e}")
+            # Legacy adapters, then dynamic adapters
+            targets = [(name, adapter) for name, adapter in
+                       (('CAN', self._can), ('Serial', self._serial), ('GPIO', self._gpio))
+                       if adapter]
+            targets.extend((name, adapter) for name, adapter in self._dynamic_adapters.items()
+                           if hasattr(adapter, 'cleanup'))
+
+            # Teardown is I/O bound (closing sockets, ports, lines): run the
+            # cleanups concurrently so it takes the slowest one, not the sum
+            if len(targets) > 1:
+                with ThreadPoolExecutor(max_workers=len(targets)) as executor:
+                    outcomes = list(executor.map(self._cleanup_adapter, targets))
+            else:
+                outcomes = [self._cleanup_adapter(target) for target in targets]
+            errors = [error for error in outcomes if error]
 
             # Clear dynamic adapter cache
             self._dynamic_adapters.clear()
@@ -354,6 +442,26 @@ class HardwareAbstractionLayer:
                 error=f"HAL cleanup failed: {str(e)}"
             )
     
+    @staticmethod
+    def _cleanup_adapter(target) -> Optional[str]:
+        """
+        Clean up one adapter.
+
+        Args:
+            target: (display name, adapter) pair
+
+        Returns:
+            Error description, or None on success
+        """
+        name, adapter = target
+        try:
+            result = adapter.cleanup()
+            if not result.success:
+                return f"{name} cleanup: {result.error}"
+        except Exception as e:
+            return f"{name} cleanup error: {e}"
+        return None
+
     def is_initialized(self) -> bool:
         """Check if HAL is initialized"""
         return self._initialized
@@ -379,11 +487,16 @@ class HardwareAbstractionLayer:
         Returns:
             List of interface names
         """
-        return list(self.config.interfaces.keys())
+        return list(self._interface_names)
+
+    @property
+    def interfaces_view(self) -> frozenset:
+        """Read-only set of configured interface names (no copy)"""
+        return self._interface_set
     
     def has_interface(self, interface_name: str) -> bool:
         """Check if interface is available"""
-        return interface_name in self.config.interfaces
+        return interface_name in self._interface_set
     
     def __enter__(self):
         """Context manager entry"""
@@ -5,22 +5,50 @@ Loads test metadata from multiple YAML files for better maintainability.
 Supports both single-file legacy format and new multi-file structure.
 """
 
+import os
+import pickle
+import sys
 import yaml
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 
 from framework.core.test_registry import MetadataConfig
 
+try:
+    from yaml import CSafeLoader as _SafeLoader  # libyaml-backed parser
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 logger = logging.getLogger(__name__)
 
+# Resolved once at import; MultiFileRegistryManager() defaults to these
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+_DEFAULT_REGISTRY_DIR = _PROJECT_ROOT / "config" / "test_registry"
+_DEFAULT_LEGACY_FILE = _PROJECT_ROOT / "config" / "test_registry.yaml"
+
+# Upper bound on threads used to read/parse suite files
+_MAX_PARSE_WORKERS = 8
+
+# Bump when MetadataConfig changes shape; invalidates the pickled registry
+_CACHE_VERSION = 5
+
+
+def _read_suite_file(suite_file: Path) -> Tuple[str, Any]:
+    """Read and parse one suite file; returns (suite_name, parsed YAML)"""
+    return sys.intern(suite_file.stem), yaml.load(suite_file.read_bytes(), Loader=_SafeLoader)
+
 
 class MultiFileRegistryManager:
     """
     Enhanced registry manager that loads from multiple files
     """
 
+    __slots__ = ('registry_dir', 'legacy_file', '_cache_path', '_registry', '_globals',
+                 '_suite_info', '_default_map', '_suites', '_tests_by_suite')
+
     def __init__(self, registry_dir: Optional[Path] = None):
         """
         Initialize multi-file registry manager
@@ -30,17 +58,23 @@ class MultiFileRegistryManager:
                          Defaults to <project_root>/config/test_registry/
         """
         if registry_dir is None:
-            project_root = Path(__file__).parent.parent.parent
-            self.registry_dir = project_root / "config" / "test_registry"
+            self.registry_dir = _DEFAULT_REGISTRY_DIR
         else:
             self.registry_dir = Path(registry_dir)
 
         # Legacy single file fallback
-        self.legacy_file = Path(__file__).parent.parent.parent / "config" / "test_registry.yaml"
+        self.legacy_file = _DEFAULT_LEGACY_FILE
+
+        # Parsed-registry sidecar, reused while the YAML files are unchanged
+        self._cache_path = self.registry_dir / ".registry_cache.pkl"
 
         self._registry = {}
         self._globals = {}
         self._suite_info = {}
+        self._default_map: Dict[str, Any] = {}  # _globals['defaults'], set on load
+        # Suite index over _registry, rebuilt after every load
+        self._suites = set()
+        self._tests_by_suite: Dict[str, List[MetadataConfig]] = {}
         self.load_registry()
 
     def load_registry(self):
@@ -48,13 +82,20 @@ class MultiFileRegistryManager:
         try:
             if self.registry_dir.exists():
                 logger.info(f"Loading multi-file registry from {self.registry_dir}")
-                self._load_multi_file_registry()
+                use_cache = os.environ.get('VORTEX_REGISTRY_NO_CACHE') != '1'
+                fingerprint = self._registry_fingerprint()
+                if not (use_cache and self._load_registry_cache(fingerprint)):
+                    self._load_multi_file_registry()
+                    if use_cache:
+                        self._write_registry_cache(fingerprint)
             elif self.legacy_file.exists():
                 logger.info(f"Loading legacy registry from {self.legacy_file}")
                 self._load_legacy_registry()
             else:
                 logger.warning("No test registry found - creating empty registry")
 
+            self._index_registry()
+
         except Exception as e:
             logger.error(f"Failed to load test registry: {e}")
             raise
@@ -65,63 +106,139 @@ class MultiFileRegistryManager:
         # Load globals first
         globals_file = self.registry_dir / "_globals.yaml"
         if globals_file.exists():
-            with open(globals_file, 'r') as f:
-                self._globals = yaml.safe_load(f) or {}
+            self._globals = yaml.load(globals_file.read_bytes(), Loader=_SafeLoader) or {}
+        self._default_map = self._globals.get('defaults', {})
+
+        # Skip special files like _globals.yaml
+        suite_files = [f for f in self.registry_dir.glob("*.yaml")
+                       if not f.name.startswith("_")]
+
+        # Read and parse suite files concurrently; merge in file order below
+        if len(suite_files) > 1:
+            workers = min(_MAX_PARSE_WORKERS, len(suite_files))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                parsed = list(executor.map(_read_suite_file, suite_files))
+        else:
+            parsed = [_read_suite_file(f) for f in suite_files]
 
         # Load each suite file
-        for suite_file in self.registry_dir.glob("*.yaml"):
-            if suite_file.name.startswith("_"):
-                continue  # Skip special files like _globals.yaml
-
-            suite_name = suite_file.stem
+        for suite_name, suite_data in parsed:
             logger.debug(f"Loading suite: {suite_name}")
 
-            with open(suite_file, 'r') as f:
-                suite_data = yaml.safe_load(f)
-
             if not suite_data:
                 continue
 
             # Store suite info
-            self._suite_info[suite_name] = suite_data.get('suite_info', {})
+            suite_info = self._suite_info[suite_name] = suite_data.get('suite_info', {})
+
+            # Defaults are the same for every test in the suite: global
+            # defaults, then the suite's default_platforms if it has any
+            suite_defaults = dict(self._default_map)
+            if suite_info.get('default_platforms'):
+                suite_defaults.setdefault('platforms', suite_info['default_platforms'])
 
             # Process tests from this suite
+            registry = self._registry
             for test_config in suite_data.get('tests', []):
-                test_config = self._apply_defaults(test_config, suite_name)
-
-                test_metadata = MetadataConfig(
-                    name=test_config['name'],
-                    suite=suite_name,
-                    category=test_config['category'],
-                    priority=test_config['priority'],
-                    description=test_config['description'],
-                    platforms=test_config.get('platforms', ['all']),
-                    requirements_hardware=test_config.get('requirements_hardware', False),
-                    max_duration=test_config.get('max_duration')
+                test_config = suite_defaults | test_config  # test values win
+                # Interned: these are repeated across tests and used as lookup keys
+                name = sys.intern(test_config['name'])
+
+                registry[name] = MetadataConfig(
+                    name,
+                    suite_name,
+                    sys.intern(test_config['category']),
+                    sys.intern(test_config['priority']),
+                    test_config['description'],
+                    test_config.get('platforms', ['all']),
+                    test_config.get('requirements_hardware', False),
+                    test_config.get('max_duration')
                 )
 
-                self._registry[test_config['name']] = test_metadata
+    def _index_registry(self):
+        """Group the loaded tests by suite (single pass over the registry)"""
+        tests_by_suite: Dict[str, List[MetadataConfig]] = {}
+        for test in self._registry.values():
+            suite_tests = tests_by_suite.get(test.suite)
+            if suite_tests is None:
+                suite_tests = tests_by_suite[test.suite] = []
+            suite_tests.append(test)
+
+        self._tests_by_suite = tests_by_suite
+        self._suites = set(tests_by_suite)
+
+    def _registry_fingerprint(self) -> Tuple:
+        """Cache version plus (name, mtime_ns, size) of every registry YAML file"""
+        with os.scandir(self.registry_dir) as entries:
+            return (_CACHE_VERSION,) + tuple(sorted(
+                (entry.name, st.st_mtime_ns, st.st_size)
+                for entry in entries if entry.name.endswith('.yaml')
+                for st in (entry.stat(),)
+            ))
+
+    def _load_registry_cache(self, fingerprint: Tuple) -> bool:
+        """
+        Restore the parsed registry from the sidecar cache.
+
+        Args:
+            fingerprint: Current registry file fingerprint
+
+        Returns:
+            True if the cache matched and was loaded, False otherwise
+        """
+        try:
+            with open(self._cache_path, 'rb') as f:
+                cached_fingerprint, registry, globals_, suite_info = pickle.load(f)
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable registry cache {self._cache_path}: {e}")
+            return False
+
+        if cached_fingerprint != fingerprint:
+            return False
+
+        self._registry, self._globals, self._suite_info = registry, globals_, suite_info
+        logger.debug(f"Loaded registry from cache {self._cache_path}")
+        return True
+
+    def _write_registry_cache(self, fingerprint: Tuple) -> None:
+        """
+        Store the parsed registry in the sidecar cache (best effort).
+
+        Args:
+            fingerprint: Registry file fingerprint taken before parsing
+        """
+        tmp_path = self._cache_path.with_name(f"{self._cache_path.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, 'wb') as f:
+                pickle.dump((fingerprint, self._registry, self._globals, self._suite_info),
+                            f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._cache_path)
+        except (OSError, pickle.PicklingError) as e:
+            logger.debug(f"Could not write registry cache {self._cache_path}: {e}")
 
     def _load_legacy_registry(self):
         """Load from legacy single file format"""
-        with open(self.legacy_file, 'r') as f:
-            config = yaml.safe_load(f)
+        config = yaml.load(self.legacy_file.read_bytes(), Loader=_SafeLoader)
 
         # Load legacy format (same as existing logic)
         for suite_name, suite_config in config.get('test_suites', {}).items():
+            suite_name = sys.intern(suite_name)
             for test_config in suite_config.get('tests', []):
+                name = sys.intern(test_config['name'])
                 test_metadata = MetadataConfig(
-                    name=test_config['name'],
+                    name=name,
                     suite=suite_name,
-                    category=test_config['category'],
-                    priority=test_config['priority'],
+                    category=sys.intern(test_config['category']),
+                    priority=sys.intern(test_config['priority']),
                     description=test_config['description'],
                     platforms=test_config.get('platforms', ['all']),
                     requirements_hardware=test_config.get('requirements_hardware', False),
                     max_duration=test_config.get('max_duration')
                 )
 
-                self._registry[test_config['name']] = test_metadata
+                self._registry[name] = test_metadata
 
         # Load legacy globals
         self._globals = {
@@ -129,34 +246,17 @@ class MultiFileRegistryManager:
             'priorities': config.get('priorities', {})
         }
 
-    def _apply_defaults(self, test_config: Dict[str, Any], suite_name: str) -> Dict[str, Any]:
-        """Apply default values from globals and suite info"""
-
-        # Apply global defaults
-        defaults = self._globals.get('defaults', {})
-        for key, default_value in defaults.items():
-            if key not in test_config:
-                test_config[key] = default_value
-
-        # Apply suite defaults
-        suite_info = self._suite_info.get(suite_name, {})
-        suite_defaults = suite_info.get('default_platforms')
-        if suite_defaults and 'platforms' not in test_config:
-            test_config['platforms'] = suite_defaults
-
-        return test_config
-
     def get_test_metadata(self, test_name: str) -> Optional[MetadataConfig]:
         """Get metadata for a specific test"""
         return self._registry.get(test_name)
 
     def get_tests_by_suite(self, suite: str) -> List[MetadataConfig]:
         """Get all tests in a specific suite"""
-        return [test for test in self._registry.values() if test.suite == suite]
+        return list(self._tests_by_suite.get(suite, ()))
 
     def get_available_suites(self) -> List[str]:
         """Get list of all available test suites"""
-        return list(set(test.suite for test in self._registry.values()))
+        return list(self._suites)
 
     def get_suite_info(self, suite_name: str) -> Dict[str, Any]:
         """Get information about a specific suite"""
@@ -178,23 +278,8 @@ class MultiFileRegistryManager:
         if not metadata:
             return []
 
-        markers = [
-            metadata.category,
-            metadata.suite,
-            metadata.priority
-        ]
-
-        # Add platform markers
-        if "all" in metadata.platforms:
-            markers.append("all_platforms")
-        else:
-            for platform in metadata.platforms:
-                markers.append(f"platform_{platform}")
-
-        if metadata.requirements_hardware:
-            markers.append("requires_hardware")
-
-        return markers
+        # Computed once when the MetadataConfig was built
+        return list(metadata.markers)
 
 
 # Global registry instance - compatible with existing code
@@ -5,17 +5,48 @@ Manages test registry split into suites/ and execution/ directories.
 Supports execution profiles with flexible test inclusion and metadata overrides.
 """
 
+import os
+import pickle
+import sys
 import yaml
 import logging
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Set
+from typing import Dict, List, Any, Optional, Set, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, replace
-from copy import deepcopy
 
-from framework.core.test_registry import MetadataConfig
+from framework.core.test_registry import (
+    MetadataConfig, PRIORITY_TO_SEVERITY, TestIndex, index_tests
+)
+
+try:
+    from yaml import CSafeLoader as _SafeLoader  # libyaml-backed parser
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on threads used to read/parse registry files
+_MAX_PARSE_WORKERS = 8
+
+# Bump when MetadataConfig or ExecutionProfile change shape; invalidates the pickled registry
+_CACHE_VERSION = 3
+
+
+def _read_yaml_file(yaml_file: Path) -> Any:
+    """Read and parse one registry YAML file"""
+    return yaml.load(yaml_file.read_bytes(), Loader=_SafeLoader)
+
+
+def _read_yaml_files(yaml_files: List[Path]) -> List[Any]:
+    """Parse several YAML files concurrently; results are in input order"""
+    if len(yaml_files) <= 1:
+        return [_read_yaml_file(f) for f in yaml_files]
+
+    workers = min(_MAX_PARSE_WORKERS, len(yaml_files))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_read_yaml_file, yaml_files))
+
 
 @dataclass
 class ExecutionProfile:
@@ -53,88 +84,186 @@ class SplitRegistryManager:
         self.execution_dir = self.registry_dir / "execution"
         self.globals_file = self.registry_dir / "_globals.yaml"
 
+        # Parsed-registry sidecar, reused while the YAML files are unchanged
+        self._cache_path = self.registry_dir / ".split_registry_cache.pkl"
+
         # Legacy fallback
         self.legacy_file = Path(__file__).parent.parent.parent / "config" / "test_registry.yaml"
 
         self._base_registry = {}  # Base test definitions from suites/
         self._globals = {}        # Global configuration
+        self._default_map: Dict[str, Any] = {}  # _globals['defaults'], set on load
         self._suite_info = {}     # Suite metadata
+        self._tests_by_suite: Dict[str, List[str]] = {}  # suite -> test names, rebuilt on load
         self._execution_profiles = {}  # Available execution profiles
+        # profile name (None = base) -> read-only execution registry, cleared on load
+        self._execution_registry_cache: Dict[Optional[str], Dict[str, MetadataConfig]] = {}
+        # profile name -> suite/category/priority indexes over that registry, cleared on load
+        self._registry_index_cache: Dict[Optional[str], TestIndex] = {}
 
         self.load_registry()
 
     def load_registry(self):
         """Load registry from split structure or legacy fallback"""
+        self._execution_registry_cache.clear()
+        self._registry_index_cache.clear()
         try:
             if self.registry_dir.exists():
                 logger.info(f"Loading split registry from {self.registry_dir}")
-                self._load_split_registry()
+                use_cache = os.environ.get('VORTEX_REGISTRY_NO_CACHE') != '1'
+                fingerprint = self._registry_fingerprint()
+                if not (use_cache and self._load_registry_cache(fingerprint)):
+                    self._load_split_registry()
+                    if use_cache:
+                        self._write_registry_cache(fingerprint)
             elif self.legacy_file.exists():
                 logger.info(f"Loading legacy registry from {self.legacy_file}")
                 self._load_legacy_fallback()
             else:
                 logger.warning("No test registry found - creating empty registry")
 
+            self._index_registry()
+
         except Exception as e:
             logger.error(f"Failed to load test registry: {e}")
             raise
 
+    def _index_registry(self):
+        """Group base test names by suite (single pass, registry order)"""
+        tests_by_suite: Dict[str, List[str]] = {}
+        for name, metadata in self._base_registry.items():
+            suite_tests = tests_by_suite.get(metadata.suite)
+            if suite_tests is None:
+                suite_tests = tests_by_suite[metadata.suite] = []
+            suite_tests.append(name)
+
+        self._tests_by_suite = tests_by_suite
+
+    def _registry_fingerprint(self) -> Tuple:
+        """Cache version plus (path, mtime_ns, size) of every split-registry YAML file"""
+        stats = []
+        for directory in (self.registry_dir, self.suites_dir, self.execution_dir):
+            try:
+                with os.scandir(directory) as entries:
+                    stats.extend(
+                        (entry.path, st.st_mtime_ns, st.st_size)
+                        for entry in entries if entry.name.endswith('.yaml')
+                        for st in (entry.stat(),)
+                    )
+            except FileNotFoundError:
+                continue
+        return (_CACHE_VERSION,) + tuple(sorted(stats))
+
+    def _load_registry_cache(self, fingerprint: Tuple) -> bool:
+        """
+        Restore the parsed registry from the sidecar cache.
+
+        Args:
+            fingerprint: Current registry file fingerprint
+
+        Returns:
+            True if the cache matched and was loaded, False otherwise
+        """
+        try:
+            with open(self._cache_path, 'rb') as f:
+                cached_fingerprint, state = pickle.load(f)
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable registry cache {self._cache_path}: {e}")
+            return False
+
+        if cached_fingerprint != fingerprint:
+            return False
+
+        (self._base_registry, self._globals, self._suite_info,
+         self._execution_profiles) = state
+        logger.debug(f"Loaded split registry from cache {self._cache_path}")
+        return True
+
+    def _write_registry_cache(self, fingerprint: Tuple) -> None:
+        """
+        Store the parsed registry in the sidecar cache (best effort).
+
+        Args:
+            fingerprint: Registry file fingerprint taken before parsing
+        """
+        state = (self._base_registry, self._globals, self._suite_info, self._execution_profiles)
+        tmp_path = self._cache_path.with_name(f"{self._cache_path.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, 'wb') as f:
+                pickle.dump((fingerprint, state), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._cache_path)
+        except (OSError, pickle.PicklingError) as e:
+            logger.debug(f"Could not write registry cache {self._cache_path}: {e}")
+
     def _load_split_registry(self):
         """Load from split directory structure"""
         # Load globals
         if self.globals_file.exists():
-            with open(self.globals_file, 'r') as f:
-                self._globals = yaml.safe_load(f) or {}
+            self._globals = yaml.load(self.globals_file.read_bytes(), Loader=_SafeLoader) or {}
+        self._default_map = self._globals.get('defaults', {})
 
-        # Load suites
+        suite_files = []
         if self.suites_dir.exists():
-            for suite_file in self.suites_dir.glob("*.yaml"):
-                self._load_suite_file(suite_file)
+            suite_files = list(self.suites_dir.glob("*.yaml"))
+        profile_files = []
+        if self.execution_dir.exists():
+            profile_files = list(self.execution_dir.glob("*.yaml"))
+
+        # Suite and profile files are independent: parse them all concurrently,
+        # then build the registry from the results in file order
+        parsed = _read_yaml_files(suite_files + profile_files)
+
+        # Load suites
+        for suite_file, suite_data in zip(suite_files, parsed):
+            self._load_suite_file(suite_file, suite_data)
 
         # Load execution profiles
-        if self.execution_dir.exists():
-            for profile_file in self.execution_dir.glob("*.yaml"):
-                self._load_execution_profile(profile_file)
+        for profile_file, profile_data in zip(profile_files, parsed[len(suite_files):]):
+            self._load_execution_profile(profile_file, profile_data)
 
-    def _load_suite_file(self, suite_file: Path):
-        """Load a single suite file"""
-        suite_name = suite_file.stem
+    def _load_suite_file(self, suite_file: Path, suite_data: Any):
+        """Load a single, already parsed, suite file"""
+        suite_name = sys.intern(suite_file.stem)
         logger.debug(f"Loading suite: {suite_name}")
 
-        with open(suite_file, 'r') as f:
-            suite_data = yaml.safe_load(f)
-
         if not suite_data:
             return
 
         # Store suite info
-        self._suite_info[suite_name] = suite_data.get('suite_info', {})
+        suite_info = self._suite_info[suite_name] = suite_data.get('suite_info', {})
+
+        # Defaults are the same for every test in the suite: global
+        # defaults, then the suite's default_platforms if it has any
+        suite_defaults = dict(self._default_map)
+        if suite_info.get('default_platforms'):
+            suite_defaults.setdefault('platforms', suite_info['default_platforms'])
 
         # Process tests from this suite
         for test_config in suite_data.get('tests', []):
-            test_config = self._apply_defaults(test_config, suite_name)
+            test_config = suite_defaults | test_config  # test values win
+            # Interned: these are repeated across tests and compared in the filters
+            name = sys.intern(test_config['name'])
 
             test_metadata = MetadataConfig(
-                name=test_config['name'],
+                name=name,
                 suite=suite_name,
-                category=test_config['category'],
-                priority=test_config['priority'],
+                category=sys.intern(test_config['category']),
+                priority=sys.intern(test_config['priority']),
                 description=test_config['description'],
                 platforms=test_config.get('platforms', ['all']),
                 requirements_hardware=test_config.get('requirements_hardware', False),
                 max_duration=test_config.get('max_duration')
             )
 
-            self._base_registry[test_config['name']] = test_metadata
+            self._base_registry[name] = test_metadata
 
-    def _load_execution_profile(self, profile_file: Path):
-        """Load an execution profile"""
+    def _load_execution_profile(self, profile_file: Path, profile_data: Any):
+        """Load an already parsed execution profile"""
         profile_name = profile_file.stem
         logger.debug(f"Loading execution profile: {profile_name}")
 
-        with open(profile_file, 'r') as f:
-            profile_data = yaml.safe_load(f)
-
         if not profile_data:
             return
 
@@ -150,24 +279,25 @@ class SplitRegistryManager:
 
     def _load_legacy_fallback(self):
         """Load from legacy single file format"""
-        with open(self.legacy_file, 'r') as f:
-            config = yaml.safe_load(f)
+        config = yaml.load(self.legacy_file.read_bytes(), Loader=_SafeLoader)
 
         # Load legacy format
         for suite_name, suite_config in config.get('test_suites', {}).items():
+            suite_name = sys.intern(suite_name)
             for test_config in suite_config.get('tests', []):
+                name = sys.intern(test_config['name'])
                 test_metadata = MetadataConfig(
-                    name=test_config['name'],
+                    name=name,
                     suite=suite_name,
-                    category=test_config['category'],
-                    priority=test_config['priority'],
+                    category=sys.intern(test_config['category']),
+                    priority=sys.intern(test_config['priority']),
                     description=test_config['description'],
                     platforms=test_config.get('platforms', ['all']),
                     requirements_hardware=test_config.get('requirements_hardware', False),
                     max_duration=test_config.get('max_duration')
                 )
 
-                self._base_registry[test_config['name']] = test_metadata
+                self._base_registry[name] = test_metadata
 
         # Load legacy globals
         self._globals = {
@@ -175,22 +305,6 @@ class SplitRegistryManager:
             'priorities': config.get('priorities', {})
         }
 
-    def _apply_defaults(self, test_config: Dict[str, Any], suite_name: str) -> Dict[str, Any]:
-        """Apply default values from globals and suite info"""
-        # Apply global defaults
-        defaults = self._globals.get('defaults', {})
-        for key, default_value in defaults.items():
-            if key not in test_config:
-                test_config[key] = default_value
-
-        # Apply suite defaults
-        suite_info = self._suite_info.get(suite_name, {})
-        suite_defaults = suite_info.get('default_platforms')
-        if suite_defaults and 'platforms' not in test_config:
-            test_config['platforms'] = suite_defaults
-
-        return test_config
-
     def get_execution_registry(self, profile_name: Optional[str] = None) -> Dict[str, MetadataConfig]:
         """
         Get registry with execution profile applied
@@ -199,8 +313,34 @@ class SplitRegistryManager:
             profile_name: Name of execution profile to apply, None for base registry
 
         Returns:
-            Dictionary of test_name -> MetadataConfig with overrides applied
+            Dict of test_name -> MetadataConfig with overrides applied (a copy
+            of the cached registry, safe for the caller to modify)
         """
+        return dict(self._cached_registry(profile_name))
+
+    def _cached_registry(self, profile_name: Optional[str]) -> Dict[str, MetadataConfig]:
+        """Execution registry built once per profile; shared, do not modify"""
+        cached = self._execution_registry_cache.get(profile_name)
+        if cached is None:
+            cached = self._build_execution_registry(profile_name)
+            self._execution_registry_cache[profile_name] = cached
+        return cached
+
+    def _registry_index(self, profile_name: Optional[str]) -> TestIndex:
+        """
+        Reverse indexes over one execution registry, built on first use.
+
+        Profile overrides can change a test's category or priority, so each
+        profile gets its own index rather than filtering the base one.
+        """
+        index = self._registry_index_cache.get(profile_name)
+        if index is None:
+            registry = self._cached_registry(profile_name)
+            index = self._registry_index_cache[profile_name] = index_tests(registry.values())
+        return index
+
+    def _build_execution_registry(self, profile_name: Optional[str]) -> Dict[str, MetadataConfig]:
+        """Build the registry for one execution profile (uncached)"""
         if profile_name is None:
             return dict(self._base_registry)
 
@@ -209,6 +349,7 @@ class SplitRegistryManager:
                            f"Available: {list(self._execution_profiles.keys())}")
 
         profile = self._execution_profiles[profile_name]
+        base_registry = self._base_registry
         execution_registry = {}
 
         # Process each include entry in the execution profile
@@ -218,20 +359,18 @@ class SplitRegistryManager:
                 logger.warning(f"Include entry missing 'suite' field: {include_entry}")
                 continue
 
-            # Get tests to include from this suite
+            # Get tests to include from this suite (all of them if 'tests' is absent)
             include_tests = include_entry.get('tests')
-            if include_tests is None:
-                # Include all tests from suite
-                suite_tests = {name: metadata for name, metadata in self._base_registry.items()
-                             if metadata.suite == suite_name}
-            else:
-                # Include specific tests
-                suite_tests = {name: metadata for name, metadata in self._base_registry.items()
-                             if metadata.suite == suite_name and name in include_tests}
+            if include_tests is not None:
+                include_tests = set(include_tests)
 
             # Apply overrides
             overrides = include_entry.get('overrides', {})
-            for test_name, metadata in suite_tests.items():
+            for test_name in self._tests_by_suite.get(suite_name, ()):
+                if include_tests is not None and test_name not in include_tests:
+                    continue
+
+                metadata = base_registry[test_name]
                 if overrides:
                     # Apply overrides to metadata
                     metadata = self._apply_overrides(metadata, overrides)
@@ -263,22 +402,22 @@ class SplitRegistryManager:
 
     def get_test_metadata(self, test_name: str, profile_name: Optional[str] = None) -> Optional[MetadataConfig]:
         """Get metadata for a specific test, optionally with profile applied"""
-        registry = self.get_execution_registry(profile_name)
+        registry = self._cached_registry(profile_name)
         return registry.get(test_name)
 
     def get_tests_by_suite(self, suite: str, profile_name: Optional[str] = None) -> List[MetadataConfig]:
         """Get all tests in a specific suite, optionally with profile applied"""
-        registry = self.get_execution_registry(profile_name)
-        return [test for test in registry.values() if test.suite == suite]
+        by_suite = self._registry_index(profile_name)[0]
+        return list(by_suite.get(suite, ()))
 
     def get_tests_by_category(self, category: str, profile_name: Optional[str] = None) -> List[MetadataConfig]:
         """Get all tests in a specific category, optionally with profile applied"""
-        registry = self.get_execution_registry(profile_name)
-        return [test for test in registry.values() if test.category == category]
+        by_category = self._registry_index(profile_name)[1]
+        return list(by_category.get(category, ()))
 
     def get_available_suites(self) -> List[str]:
         """Get list of all available test suites"""
-        return list(set(test.suite for test in self._base_registry.values()))
+        return list(self._tests_by_suite)
 
     def get_available_execution_profiles(self) -> List[str]:
         """Get list of all available execution profiles"""
@@ -290,13 +429,15 @@ class SplitRegistryManager:
 
     def filter_tests_by_names(self, test_names: List[str], profile_name: Optional[str] = None) -> List[MetadataConfig]:
         """Filter tests by specific test names"""
-        registry = self.get_execution_registry(profile_name)
+        registry = self._cached_registry(profile_name)
         return [registry[name] for name in test_names if name in registry]
 
     def filter_tests_by_suites(self, suite_names: List[str], profile_name: Optional[str] = None) -> List[MetadataConfig]:
         """Filter tests by specific suite names"""
-        registry = self.get_execution_registry(profile_name)
-        return [test for test in registry.values() if test.suite in suite_names]
+        # Scan in registry order; the set keeps each membership test O(1)
+        wanted = set(suite_names)
+        registry = self._cached_registry(profile_name)
+        return [test for test in registry.values() if test.suite in wanted]
 
     def get_pytest_markers(self, test_name: str, profile_name: Optional[str] = None) -> List[str]:
         """Generate pytest markers for a test"""
@@ -304,23 +445,8 @@ class SplitRegistryManager:
         if not metadata:
             return []
 
-        markers = [
-            metadata.category,
-            metadata.suite,
-            metadata.priority
-        ]
-
-        # Add platform markers
-        if "all" in metadata.platforms:
-            markers.append("all_platforms")
-        else:
-            for platform in metadata.platforms:
-                markers.append(f"platform_{platform}")
-
-        if metadata.requirements_hardware:
-            markers.append("requires_hardware")
-
-        return markers
+        # Computed once when the MetadataConfig was built
+        return list(metadata.markers)
 
     def get_allure_labels(self, test_name: str, profile_name: Optional[str] = None) -> Dict[str, str]:
         """Generate Allure labels for a test"""
@@ -328,22 +454,12 @@ class SplitRegistryManager:
         if not metadata:
             return {}
 
-        return {
-            'feature': metadata.suite.replace('_', ' ').title(),
-            'story': metadata.description,
-            'severity': self._priority_to_severity(metadata.priority),
-            'tag': metadata.category
-        }
+        # Computed once when the MetadataConfig was built
+        return dict(metadata.allure_labels)
 
     def _priority_to_severity(self, priority: str) -> str:
         """Convert priority to Allure severity"""
-        mapping = {
-            'critical': 'blocker',
-            'high': 'critical',
-            'medium': 'normal',
-            'low': 'minor'
-        }
-        return mapping.get(priority, 'normal')
+        return PRIORITY_TO_SEVERITY.get(priority, 'normal')
 
     def list_registry_files(self) -> List[Path]:
         """List all registry files being used"""
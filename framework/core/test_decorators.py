@@ -5,8 +5,6 @@ Automatically applies pytest and allure decorators based on test registry config
 Keeps test code clean by externalizing all decorator logic.
 """
 
-import pytest
-import allure
 import functools
 import logging
 from typing import Callable, Any
@@ -15,6 +13,22 @@ from framework.core.test_registry import get_test_registry
 logger = logging.getLogger(__name__)
 
 
+# pytest and allure are imported on first use so that importing this module
+# for metadata utilities does not load either package
+@functools.lru_cache(maxsize=None)
+def _pytest():
+    """Import and return the pytest module"""
+    import pytest
+    return pytest
+
+
+@functools.lru_cache(maxsize=None)
+def _allure():
+    """Import and return the allure module"""
+    import allure
+    return allure
+
+
 def auto_configure_test(func: Callable) -> Callable:
     """
     Automatically configure test with pytest markers and allure decorators
@@ -41,6 +55,9 @@ def auto_configure_test(func: Callable) -> Callable:
         logger.warning(f"Test {test_name} not found in registry, using defaults")
         return wrapper
 
+    pytest = _pytest()
+    allure = _allure()
+
     # Apply pytest markers dynamically
     for marker in registry.get_pytest_markers(test_name):
         if hasattr(pytest.mark, marker):
@@ -94,8 +111,8 @@ def simple_test(func: Callable) -> Callable:
         return func(*args, **kwargs)
 
     # Apply basic smoke test marker
-    wrapper = pytest.mark.smoke(wrapper)
-    wrapper = allure.feature("Basic Tests")(wrapper)
+    wrapper = _pytest().mark.smoke(wrapper)
+    wrapper = _allure().feature("Basic Tests")(wrapper)
 
     return wrapper
 
@@ -115,6 +132,8 @@ def platform_specific_test(platforms: list):
         def wrapper(*args, **kwargs):
             return func(*args, **kwargs)
 
+        pytest = _pytest()
+
         # Add platform markers
         for platform in platforms:
             wrapper = getattr(pytest.mark, f"platform_{platform}")(wrapper)
@@ -133,7 +152,21 @@ def platform_specific_test(platforms: list):
 
 
 # Convenience decorators for common test types
-smoke_test = lambda func: auto_configure_test(pytest.mark.smoke(func))
-regression_test = lambda func: auto_configure_test(pytest.mark.regression(func))
-integration_test = lambda func: auto_configure_test(pytest.mark.integration(func))
-performance_test = lambda func: auto_configure_test(pytest.mark.performance(func))
\ No newline at end of file
+def smoke_test(func: Callable) -> Callable:
+    """Mark as smoke and auto-configure from the registry"""
+    return auto_configure_test(_pytest().mark.smoke(func))
+
+
+def regression_test(func: Callable) -> Callable:
+    """Mark as regression and auto-configure from the registry"""
+    return auto_configure_test(_pytest().mark.regression(func))
+
+
+def integration_test(func: Callable) -> Callable:
+    """Mark as integration and auto-configure from the registry"""
+    return auto_configure_test(_pytest().mark.integration(func))
+
+
+def performance_test(func: Callable) -> Callable:
+    """Mark as performance and auto-configure from the registry"""
+    return auto_configure_test(_pytest().mark.performance(func))
\ No newline at end of file
@@ -8,13 +8,26 @@ Keeps test code clean by externalizing all pytest/allure decorators.
 import yaml
 import logging
 from pathlib import Path
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, List, Any, Optional, Tuple
+from dataclasses import dataclass, field
+
+try:
+    from yaml import CSafeLoader as _SafeLoader  # libyaml-backed parser
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
 
 logger = logging.getLogger(__name__)
 
+# Registry priority -> Allure severity level
+PRIORITY_TO_SEVERITY = {
+    'critical': 'blocker',
+    'high': 'critical',
+    'medium': 'normal',
+    'low': 'minor'
+}
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MetadataConfig:
     """Test metadata from configuration"""
     name: str
@@ -25,6 +38,59 @@ class MetadataConfig:
     platforms: List[str]
     requirements_hardware: bool = False
     max_duration: Optional[str] = None
+    # Pytest markers, Allure labels and a set view of platforms, derived from
+    # the fields above (recomputed by dataclasses.replace)
+    markers: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    allure_labels: Dict[str, str] = field(init=False, repr=False, compare=False)
+    platform_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        platform_set = frozenset(self.platforms)
+        object.__setattr__(self, 'platform_set', platform_set)
+
+        markers = [self.category, self.suite, self.priority]
+
+        # Add platform markers for all specified platforms
+        if "all" in platform_set:
+            markers.append("all_platforms")
+        else:
+            markers.extend(f"platform_{platform}" for platform in self.platforms)
+
+        if self.requirements_hardware:
+            markers.append("requires_hardware")
+
+        object.__setattr__(self, 'markers', tuple(markers))
+        object.__setattr__(self, 'allure_labels', {
+            'feature': self.suite.replace('_', ' ').title(),
+            'story': self.description,
+            'severity': PRIORITY_TO_SEVERITY.get(self.priority, 'normal'),
+            'tag': self.category
+        })
+
+
+# suite / category / priority -> tests, each in registry order
+TestIndex = Tuple[Dict[str, List[MetadataConfig]], Dict[str, List[MetadataConfig]],
+                  Dict[str, List[MetadataConfig]]]
+
+
+def index_tests(tests: Iterable[MetadataConfig]) -> TestIndex:
+    """
+    Group tests by suite, category and priority in a single pass.
+
+    Args:
+        tests: Test metadata in registry order
+
+    Returns:
+        (by_suite, by_category, by_priority) dictionaries of test lists
+    """
+    by_suite: Dict[str, List[MetadataConfig]] = {}
+    by_category: Dict[str, List[MetadataConfig]] = {}
+    by_priority: Dict[str, List[MetadataConfig]] = {}
+    for test in tests:
+        by_suite.setdefault(test.suite, []).append(test)
+        by_category.setdefault(test.category, []).append(test)
+        by_priority.setdefault(test.priority, []).append(test)
+    return by_suite, by_category, by_priority
 
 
 class RegistryManager:
@@ -44,13 +110,18 @@ class RegistryManager:
         self._registry = {}
         self._categories = {}
         self._priorities = {}
+        # Reverse indexes over _registry, rebuilt after every load
+        self._by_suite: Dict[str, List[MetadataConfig]] = {}
+        self._by_category: Dict[str, List[MetadataConfig]] = {}
+        self._by_priority: Dict[str, List[MetadataConfig]] = {}
+        self._by_platform: Dict[str, List[MetadataConfig]] = {}  # filled on first query
         self.load_registry()
 
     def load_registry(self):
         """Load test registry from YAML configuration"""
         try:
-            with open(self.config_path, 'r') as f:
-                config = yaml.safe_load(f)
+            with open(self.config_path, 'rb') as f:
+                config = yaml.load(f.read(), Loader=_SafeLoader)
 
             self._categories = config.get('categories', {})
             self._priorities = config.get('priorities', {})
@@ -58,6 +129,9 @@ class RegistryManager:
             # Parse test suites
             for suite_name, suite_config in config.get('test_suites', {}).items():
                 for test_config in suite_config.get('tests', []):
+                    # Add category max_duration if available
+                    category_info = self._categories.get(test_config['category'], {})
+
                     test_metadata = MetadataConfig(
                         name=test_config['name'],
                         suite=suite_name,
@@ -65,15 +139,16 @@ class RegistryManager:
                         priority=test_config['priority'],
                         description=test_config['description'],
                         platforms=test_config['platforms'],
-                        requirements_hardware=test_config.get('requirements_hardware', False)
+                        requirements_hardware=test_config.get('requirements_hardware', False),
+                        max_duration=category_info.get('max_duration')
                     )
 
-                    # Add category max_duration if available
-                    category_info = self._categories.get(test_config['category'], {})
-                    test_metadata.max_duration = category_info.get('max_duration')
-
                     self._registry[test_config['name']] = test_metadata
 
+            (self._by_suite, self._by_category,
+             self._by_priority) = index_tests(self._registry.values())
+            self._by_platform = {}
+
             logger.info(f"Loaded {len(self._registry)} tests from registry")
 
         except Exception as e:
@@ -86,29 +161,33 @@ class RegistryManager:
 
     def get_tests_by_category(self, category: str) -> List[MetadataConfig]:
         """Get all tests in a specific category"""
-        return [test for test in self._registry.values() if test.category == category]
+        return list(self._by_category.get(category, ()))
 
     def get_tests_by_suite(self, suite: str) -> List[MetadataConfig]:
         """Get all tests in a specific suite"""
-        return [test for test in self._registry.values() if test.suite == suite]
+        return list(self._by_suite.get(suite, ()))
 
     def get_tests_by_platform(self, platform: str) -> List[MetadataConfig]:
         """Get all tests compatible with a platform"""
-        return [
-            test for test in self._registry.values()
-            if platform in test.platforms or "all" in test.platforms
-        ]
+        # Platforms are open-ended ("all" matches any), so index on first query
+        tests = self._by_platform.get(platform)
+        if tests is None:
+            tests = self._by_platform[platform] = [
+                test for test in self._registry.values()
+                if platform in test.platform_set or "all" in test.platform_set
+            ]
+        return list(tests)
 
     def get_tests_by_priority(self, priority: str) -> List[MetadataConfig]:
         """Get all tests with specific priority"""
-        return [test for test in self._registry.values() if test.priority == priority]
+        return list(self._by_priority.get(priority, ()))
 
     def is_test_compatible(self, test_name: str, platform: str) -> bool:
         """Check if test is compatible with platform"""
         metadata = self.get_test_metadata(test_name)
         if not metadata:
             return False
-        return platform in metadata.platforms or "all" in metadata.platforms
+        return platform in metadata.platform_set or "all" in metadata.platform_set
 
     def get_pytest_markers(self, test_name: str) -> List[str]:
         """Generate pytest markers for a test"""
@@ -116,23 +195,7 @@ class RegistryManager:
         if not metadata:
             return []
 
-        markers = [
-            metadata.category,
-            metadata.suite,
-            metadata.priority
-        ]
-
-        # Add platform markers for all specified platforms
-        if "all" in metadata.platforms:
-            markers.append("all_platforms")
-        else:
-            for platform in metadata.platforms:
-                markers.append(f"platform_{platform}")
-
-        if metadata.requirements_hardware:
-            markers.append("requires_hardware")
-
-        return markers
+        return list(metadata.markers)
 
     def get_allure_labels(self, test_name: str) -> Dict[str, str]:
         """Generate Allure labels for a test"""
@@ -140,22 +203,12 @@ class RegistryManager:
         if not metadata:
             return {}
 
-        return {
-            'feature': metadata.suite.replace('_', ' ').title(),
-            'story': metadata.description,
-            'severity': self._priority_to_severity(metadata.priority),
-            'tag': metadata.category
-        }
+        # Computed once when the MetadataConfig was built
+        return dict(metadata.allure_labels)
 
     def _priority_to_severity(self, priority: str) -> str:
         """Convert priority to Allure severity"""
-        mapping = {
-            'critical': 'blocker',
-            'high': 'critical',
-            'medium': 'normal',
-            'low': 'minor'
-        }
-        return mapping.get(priority, 'normal')
+        return PRIORITY_TO_SEVERITY.get(priority, 'normal')
 
     def list_available_categories(self) -> List[str]:
         """List all available test categories"""
@@ -163,7 +216,7 @@ class RegistryManager:
 
     def list_available_suites(self) -> List[str]:
         """List all available test suites"""
-        return list(set(test.suite for test in self._registry.values()))
+        return list(self._by_suite)
 
     def list_available_priorities(self) -> List[str]:
         """List all available priorities"""
@@ -11,6 +11,7 @@ Usage:
 4. Add device config to config/hardware/your_platform.yaml
 """
 
+from collections import deque
 from framework.core.types import OperationResult
 
 
@@ -209,7 +210,7 @@ class Mock{{ADAPTER_CLASS}}({{ADAPTER_CLASS}}):
 
     def __init__(self, config):
         super().__init__(config)
-        self._mock_data_queue = []
+        self._mock_data_queue = deque()
 
     def initialize(self) -> OperationResult:
         """Mock initialization - always succeeds"""
@@ -240,7 +241,7 @@ class Mock{{ADAPTER_CLASS}}({{ADAPTER_CLASS}}):
             return OperationResult(success=False, error="Not initialized")
 
         if self._mock_data_queue:
-            data = self._mock_data_queue.pop(0)
+            data = self._mock_data_queue.popleft()
         else:
             data = "mock_default_response"
 
@@ -165,6 +165,133 @@ def cli_interface(hardware):
     return hardware.cli_interface
 
 
+# In-memory stand-ins for adapter code-path tests. The adapters open them
+# through their normal initialize(), so no CAN hardware, vcan or UART is needed.
+
+class FakeCANBus:
+    """Minimal python-can bus: records sent frames, serves queued ``rx`` frames"""
+
+    def __init__(self):
+        self.sent = []
+        self.rx = []
+        self.filters = None
+        self.fail_ids = set()  # arbitration IDs whose send() raises
+        self.is_shutdown = False
+
+    def send(self, msg, timeout=None):
+        if msg.arbitration_id in self.fail_ids:
+            raise OSError(f"TX failed for 0x{msg.arbitration_id:X}")
+        self.sent.append(msg)
+
+    def recv(self, timeout=None):
+        return self.rx.pop(0) if self.rx else None
+
+    def set_filters(self, filters):
+        self.filters = filters
+
+    def shutdown(self):
+        self.is_shutdown = True
+
+
+class FakeSerialPort:
+    """Minimal pyserial port serving the bytes queued in ``rx``"""
+
+    def __init__(self):
+        self.rx = bytearray()
+        self.is_open = True
+
+    def readinto(self, buf):
+        count = min(len(buf), len(self.rx))
+        buf[:count] = self.rx[:count]
+        del self.rx[:count]
+        return count
+
+    def close(self):
+        self.is_open = False
+
+
+@pytest.fixture(scope="function")
+def fake_can_bus(monkeypatch):
+    """
+    Provides a FakeCANBus that can.Bus() returns for the rest of the test.
+
+    Scope: function
+    """
+    import can
+
+    bus = FakeCANBus()
+    monkeypatch.setattr(can, 'Bus', lambda **kwargs: bus)
+    return bus
+
+
+@pytest.fixture(scope="function")
+def fake_can_adapter(fake_can_bus):
+    """
+    Provides a factory for CAN adapters initialized on fake_can_bus.
+
+    Usage in tests:
+        def test_filters(fake_can_bus, fake_can_adapter):
+            adapter = fake_can_adapter(tx_queue=True)
+
+    Scope: function (adapters are cleaned up after the test)
+    """
+    from framework.adapters.can_adapter import CANAdapter
+
+    adapters = []
+
+    def make(adapter_cls=CANAdapter, **config):
+        adapter = adapter_cls({'channel': 'vcan0', 'bitrate': 500000, **config})
+        result = adapter.initialize()
+        if not result.success:
+            pytest.fail(f"CAN initialization failed: {result.error}")
+        adapters.append(adapter)
+        return adapter
+
+    yield make
+
+    for adapter in adapters:
+        adapter.cleanup()
+
+
+@pytest.fixture(scope="function")
+def fake_serial_port(monkeypatch):
+    """
+    Provides a FakeSerialPort that serial.Serial() returns for the rest of the test.
+
+    Scope: function
+    """
+    import serial
+
+    port = FakeSerialPort()
+    monkeypatch.setattr(serial, 'Serial', lambda **kwargs: port)
+    return port
+
+
+@pytest.fixture(scope="function")
+def fake_serial_adapter(fake_serial_port):
+    """
+    Provides a factory for serial adapters initialized on fake_serial_port.
+
+    Scope: function (adapters are cleaned up after the test)
+    """
+    from framework.adapters.serial_adapter import SerialAdapter
+
+    adapters = []
+
+    def make(**config):
+        adapter = SerialAdapter({'port': 'fake_serial', **config})
+        result = adapter.initialize()
+        if not result.success:
+            pytest.fail(f"Serial initialization failed: {result.error}")
+        adapters.append(adapter)
+        return adapter
+
+    yield make
+
+    for adapter in adapters:
+        adapter.cleanup()
+
+
 # Dynamic fixture support for auto-discovered adapters
 # This allows any {adapter_name}_interface to work automatically
 
@@ -0,0 +1,244 @@
+"""
+CAN Adapter Code Path Tests
+
+Exercises CANAdapter internals (TX queue, filters, batched receive) against
+the conftest fake bus, so they run without CAN hardware or a vcan interface.
+"""
+
+import asyncio
+import ctypes
+import struct
+import time
+
+import can
+
+from framework.adapters.can_adapter import (
+    AsyncCANAdapter, _MmsgReceiver, _decode_filter, _encode_filter, optimize_filters
+)
+from framework.core.test_decorators import auto_configure_test
+
+
+def _accepts(flt, can_id):
+    """True if python-can filter dict ``flt`` lets ``can_id`` through"""
+    return (can_id & flt["can_mask"]) == (flt["can_id"] & flt["can_mask"])
+
+
+@auto_configure_test
+def test_can_tx_queue_reports_worker_errors(fake_can_bus, fake_can_adapter):
+    """Queued sends normalize payloads and report worker send failures"""
+    bus = fake_can_bus
+    bus.fail_ids.add(0x7FF)
+    adapter = fake_can_adapter(tx_queue=True, tx_batch_delay_ms=0)
+
+    result = adapter.send_messages([(0x100, [1, 2], False), (0x7FF, b'\x03', False)])
+    assert result.success and result.data == 2
+
+    deadline = time.monotonic() + 2.0
+    while adapter.get_tx_error_count() == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert adapter.get_tx_error_count() == 1, "Worker send failure not counted"
+
+    # The failure is reported by the next queued call, and only once
+    result = adapter.send_message(0x101, [4])
+    assert not result.success
+    assert "1 queued CAN message(s) failed" in result.error
+    assert adapter.send_message(0x102, [5]).success
+
+    # cleanup() flushes the queue before stopping the worker
+    assert adapter.cleanup().success
+    assert [m.arbitration_id for m in bus.sent] == [0x100, 0x101, 0x102]
+    assert all(isinstance(m.data, (bytes, bytearray)) for m in bus.sent), \
+        "Queued payloads should be normalized to bytes"
+
+
+@auto_configure_test
+def test_can_mmsg_receiver_skips_rtr_and_error_frames():
+    """Batched receive decodes data frames and drops RTR/error frames"""
+    raw_frames = [
+        (0x123, b'\x01\x02'),                    # standard data frame
+        (0x80000000 | 0x18DAF110, b'\xAA'),       # extended data frame
+        (0x40000000 | 0x321, b''),                # remote (RTR) frame
+        (0x20000000 | 0x004, b'\x00' * 8),        # error frame
+    ]
+    receiver = _MmsgReceiver(None, -1, capacity=8)
+
+    def fake_recvmmsg(fd, hdrs, n, flags, timeout):
+        # Mimic the kernel: fill the preallocated frame slots and headers
+        for i, (can_id, data) in enumerate(raw_frames):
+            frame = struct.pack("=IB3x8s", can_id, len(data), data)
+            ctypes.memmove(ctypes.addressof(receiver._frames) + i * 72, frame, 16)
+            receiver._hdrs[i].msg_len = 16
+            receiver._hdrs[i].msg_hdr.msg_controllen = 0
+        return len(raw_frames)
+
+    receiver._recvmmsg = fake_recvmmsg
+    messages = receiver.recv(8)
+
+    assert [(m.arbitration_id, m.is_extended_id) for m in messages] == [
+        (0x123, False), (0x18DAF110, True)
+    ]
+    assert bytes(messages[0].data) == b'\x01\x02'
+    assert bytes(messages[1].data) == b'\xAA'
+    assert not any(m.is_fd for m in messages)
+
+
+@auto_configure_test
+def test_can_flush_rx_buffer_pauses_rx_worker(fake_can_bus, fake_can_adapter):
+    """Flushing with the RX worker running drains queue and bus, then resumes"""
+    bus = fake_can_bus
+    adapter = fake_can_adapter(rx_thread=True, rx_poll_interval=0.01)
+
+    bus.rx.extend(can.Message(arbitration_id=i, data=b'\x01') for i in range(5))
+    deadline = time.monotonic() + 2.0
+    while bus.rx and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert adapter.flush_rx_buffer() == 5
+    assert adapter._rx_thread is not None and adapter._rx_thread.is_alive(), \
+        "RX worker should be restarted after the flush"
+
+    bus.rx.append(can.Message(arbitration_id=0x200, data=b'\x02'))
+    msg = adapter.receive_message(timeout=2.0)
+    assert msg is not None and msg.arbitration_id == 0x200
+    assert adapter.cleanup().success
+
+
+@auto_configure_test
+def test_can_filter_encoding_round_trip():
+    """Filter dicts survive encoding to SocketCAN (id, mask) words and back"""
+    filters = [
+        {"can_id": 0x123, "can_mask": 0x7FF},
+        {"can_id": 0x123, "can_mask": 0x7FF, "extended": False},
+        {"can_id": 0x18DAF110, "can_mask": 0x1FFFFFFF, "extended": True},
+    ]
+    for flt in filters:
+        assert _decode_filter(*_encode_filter(flt)) == flt
+
+    # The ID type only constrains the match when "extended" is given
+    assert _encode_filter(filters[0]) == (0x123, 0x7FF)
+    assert _encode_filter(filters[1]) == (0x123, 0x800007FF)
+    assert _encode_filter(filters[2]) == (0x98DAF110, 0x9FFFFFFF)
+
+
+@auto_configure_test
+def test_can_set_filters_merges_to_hw_slots(fake_can_bus, fake_can_adapter):
+    """Filter sets larger than the hardware slots are merged, never narrowed"""
+    filters = [{"can_id": can_id, "can_mask": 0x7FF}
+               for can_id in (0x100, 0x101, 0x102, 0x103, 0x200, 0x201)]
+    ids = range(0x800)
+
+    merged = optimize_filters(filters, 2)
+    assert len(merged) == 2
+    for can_id in ids:
+        if any(_accepts(f, can_id) for f in filters):
+            assert any(_accepts(f, can_id) for f in merged), hex(can_id)
+    # Closest IDs merge first: 0x100-0x103 and 0x200-0x201 stay apart
+    assert sorted(f["can_id"] for f in merged) == [0x100, 0x200]
+
+    bus = fake_can_bus
+    adapter = fake_can_adapter()
+    assert adapter.set_filters(filters, max_hw=2).success
+    assert bus.filters == merged
+    # The adapter keeps the exact set for software filtering
+    assert adapter.filters == filters
+
+    assert adapter.set_filters(filters).success
+    assert bus.filters == filters, "Without max_hw the set is applied as-is"
+
+
+@auto_configure_test
+def test_async_can_adapter_recv(fake_can_bus, fake_can_adapter):
+    """AsyncCANAdapter delivers frames through the event loop and times out"""
+    bus = fake_can_bus
+    adapter = fake_can_adapter(AsyncCANAdapter)
+
+    async def exercise():
+        assert (await adapter.start()).success
+        assert await adapter.recv(timeout=0.05) is None
+
+        bus.rx.append(can.Message(arbitration_id=0x7E8, data=b'\x02\x50\x01',
+                                  is_extended_id=False))
+        msg = await adapter.recv(timeout=2.0)
+        assert msg is not None
+        assert msg.arbitration_id == 0x7E8
+        assert bytes(msg.data) == b'\x02\x50\x01'
+
+    asyncio.run(exercise())
+    assert adapter.cleanup().success
+
+    # The Notifier and the RX worker would both read the bus
+    adapter = fake_can_adapter(AsyncCANAdapter, rx_thread=True, rx_poll_interval=0.01)
+    result = asyncio.run(adapter.start())
+    assert not result.success and "rx_thread" in result.error
+    assert adapter.cleanup().success
+
+
+@auto_configure_test
+def test_can_receive_into_pool_recycles_slots(fake_can_bus, fake_can_adapter):
+    """Pooled receive fills preallocated messages and reuses them round-robin"""
+    bus = fake_can_bus
+    adapter = fake_can_adapter(rx_pool_size=2)
+    bus.rx.extend(can.Message(arbitration_id=0x100 + i, data=bytes([i]),
+                              is_extended_id=False, timestamp=float(i))
+                  for i in range(3))
+
+    first = adapter.receive_message_into_pool(timeout=0)
+    second = adapter.receive_message_into_pool(timeout=0)
+    assert first is not second
+    assert (first.arbitration_id, bytes(first.data), first.timestamp) == (0x100, b'\x00', 0.0)
+    assert (second.arbitration_id, bytes(second.data)) == (0x101, b'\x01')
+    assert not first.is_extended_id
+
+    # The third frame overwrites the first slot
+    third = adapter.receive_message_into_pool(timeout=0)
+    assert third is first
+    assert (third.arbitration_id, bytes(third.data)) == (0x102, b'\x02')
+
+    assert adapter.receive_message_into_pool(timeout=0) is None
+
+
+@auto_configure_test
+def test_can_receive_ids_only(fake_can_bus, fake_can_adapter):
+    """ID-only receive paths return arbitration IDs and consume the frames"""
+    bus = fake_can_bus
+    adapter = fake_can_adapter()
+    bus.rx.extend(can.Message(arbitration_id=can_id, data=b'\x00')
+                  for can_id in (0x10, 0x18DAF110, 0x30, 0x40, 0x50))
+
+    assert adapter.peek_arbitration_id(timeout=0) == 0x10
+
+    ids = adapter.receive_ids_batch(max_n=3, timeout=0)
+    assert ids.typecode == 'I'
+    assert list(ids) == [0x18DAF110, 0x30, 0x40]
+
+    # Stops early once the bus is drained
+    assert list(adapter.receive_ids_batch(max_n=3, timeout=0)) == [0x50]
+    assert len(adapter.receive_ids_batch(max_n=3, timeout=0)) == 0
+    assert adapter.peek_arbitration_id(timeout=0) is None
+
+
+@auto_configure_test
+def test_can_filter_batch_matches_active_filters(fake_can_adapter):
+    """filter_batch agrees with per-filter matching across mixed masks"""
+    adapter = fake_can_adapter()
+    ids = [0x100, 0x101, 0x1FF, 0x200, 0x2F0, 0x2FF, 0x300, 0x18DAF110, 0x18DAF111]
+
+    # No filters: everything passes, as on the bus
+    assert adapter.filter_batch(ids) == [True] * len(ids)
+
+    # Single mask group
+    assert adapter.add_filters([(0x100, None), (0x200, None)]).success
+    assert adapter.filter_batch(ids) == [can_id in (0x100, 0x200) for can_id in ids]
+
+    # Several mask groups, including a range mask and an extended ID
+    filters = adapter.filters + [
+        {"can_id": 0x2F0, "can_mask": 0x7F0},
+        {"can_id": 0x18DAF110, "can_mask": 0x1FFFFFFF, "extended": True},
+    ]
+    assert adapter.set_filters(filters).success
+    expected = [any(_accepts(f, can_id) for f in filters) for can_id in ids]
+    assert adapter.filter_batch(ids) == expected
+    assert expected == [True, False, False, True, True, True, False, True, False]
+
+    assert adapter.clear_filters().success
+    assert adapter.filter_batch(ids) == [True] * len(ids)
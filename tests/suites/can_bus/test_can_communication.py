@@ -81,4 +81,4 @@ class TestCANFiltering:
 
         # Verify filter was added
         filters = can_interface.get_filters()
-        assert any(f["id"] == filter_id for f in filters), "Filter not found"
\ No newline at end of file
+        assert (filter_id, filter_mask) in filters, "Filter not found"
\ No newline at end of file
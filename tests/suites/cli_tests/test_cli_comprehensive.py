@@ -8,6 +8,7 @@ Tests for CLI adapter functionality including:
 - Mock adapter behavior
 """
 
+from framework.adapters.cli_adapter import MockCliAdapter
 from framework.core.test_decorators import auto_configure_test
 
 
@@ -161,6 +162,25 @@ def test_cli_ssh_command_execution(cli_interface):
     print(f"   Output: {result.data['output']}")
 
 
+@auto_configure_test
+def test_cli_parallel_ssh_commands(cli_interface):
+    """Test concurrent SSH command execution"""
+    # Initialize interface
+    init_result = cli_interface.initialize()
+    assert init_result.success
+
+    jobs = [{'command': f"echo {i}", 'host': f"host{i}"} for i in range(4)]
+    results = cli_interface.send_ssh_commands_parallel(jobs)
+
+    assert len(results) == len(jobs), "Expected one result per job"
+    for job, result in zip(jobs, results):
+        assert result.success, f"SSH command failed: {result.error}"
+        assert job['command'] in result.data['output'], "Results should keep submission order"
+
+    print(f"✅ Parallel SSH execution working")
+    print(f"   Jobs: {len(jobs)}")
+
+
 @auto_configure_test
 def test_cli_command_history(cli_interface):
     """Test command history tracking (mock adapter feature)"""
@@ -288,4 +308,48 @@ def test_cli_cleanup(cli_interface):
     # Verify it's no longer ready
     assert not cli_interface.is_ready(), "Interface should not be ready after cleanup"
 
-    print(f"✅ CLI cleanup working")
\ No newline at end of file
+    print(f"✅ CLI cleanup working")
+
+
+@auto_configure_test
+def test_cli_output_diff_truncation():
+    """Test the mismatch diff is limited to diff_max_lines lines"""
+    cli = MockCliAdapter({'diff_max_lines': 5})
+
+    expected = "".join(f"line {i}\n" for i in range(50))
+    actual = expected.replace("line 2\n", "LINE 2\n").replace("line 40\n", "LINE 40\n")
+    comparison = cli.compare_output(expected, actual, ignore_whitespace=False)
+    assert not comparison.data['match']
+
+    diff = comparison.data['diff']
+    assert "-line 2\n" in diff and "+LINE 2\n" in diff
+    assert "LINE 40" not in diff, "Lines past diff_max_lines should not be diffed"
+    assert diff.endswith("... diff limited to the first 5 lines\n")
+
+    # Short outputs are diffed in full, with no truncation note
+    comparison = cli.compare_output("a\nb\n", "a\nc\n", ignore_whitespace=False)
+    assert "+c" in comparison.data['diff']
+    assert "diff limited" not in comparison.data['diff']
+
+    print(f"✅ Diff truncation working")
+
+
+@auto_configure_test
+def test_cli_output_comparison_identical_inputs():
+    """Test identical outputs match and report the same normalized text"""
+    cli = MockCliAdapter({})
+    output = "  Status:   OK \n  Errors:  0  "
+
+    comparison = cli.compare_output(output, output, ignore_case=True)
+    assert comparison.success and comparison.data['match']
+    assert comparison.data['diff'] == ""
+    assert comparison.data['normalized_expected'] == "status: ok errors: 0"
+    assert comparison.data['normalized_actual'] == comparison.data['normalized_expected']
+
+    # Equal after normalization only: same result through the full path
+    comparison = cli.compare_output("status: ok errors: 0", output, ignore_case=True)
+    assert comparison.data['match']
+    assert comparison.data['normalized_actual'] == "status: ok errors: 0"
+
+    print(f"✅ Identical output comparison working")
+
@@ -0,0 +1,82 @@
+"""
+Hardware Config Cache Tests
+
+Exercises the ConfigLoader caches (in-process memo and on-disk pickle)
+against a throwaway config directory, so the shipped configs are untouched.
+"""
+
+import os
+
+from framework.core.config_loader import ConfigLoader
+from framework.core.test_decorators import auto_configure_test
+
+_PLATFORM_YAML = """\
+platform:
+  name: "Cache Test Platform"
+  version: "{version}"
+  vendor: "Test Environment"
+interfaces:
+  can:
+    type: "mock"
+    channel: "vcan0"
+    bitrate: 500000
+test_parameters:
+  retry_count: 1
+"""
+
+
+def _write_platform(config_dir, version):
+    """Write the cache_test platform YAML and return its path"""
+    hardware_dir = config_dir / "hardware"
+    hardware_dir.mkdir(parents=True, exist_ok=True)
+    config_file = hardware_dir / "cache_test.yaml"
+    config_file.write_text(_PLATFORM_YAML.format(version=version))
+    return config_file
+
+
+@auto_configure_test
+def test_config_cache_reloads_edited_yaml(tmp_path):
+    """In-process config cache hands out copies and notices edited files"""
+    config_file = _write_platform(tmp_path, "1.0")
+
+    first = ConfigLoader(tmp_path).load_hardware_config("cache_test")
+    first.interfaces["can"]["bitrate"] = 1
+    second = ConfigLoader(tmp_path).load_hardware_config("cache_test")
+    assert second is not first
+    assert second.interfaces["can"]["bitrate"] == 500000, \
+        "Mutating one loaded config leaked into the cache"
+
+    # A changed file stat is a new cache key; no invalidate_cache() needed
+    _write_platform(tmp_path, "2.0.1")
+    stat = config_file.stat()
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    reloaded = ConfigLoader(tmp_path).load_hardware_config("cache_test")
+    assert reloaded.platform.version == "2.0.1"
+
+
+@auto_configure_test
+def test_config_disk_cache_round_trip(tmp_path):
+    """Validated configs are pickled to disk, reused and rebuilt on edits"""
+    config_file = _write_platform(tmp_path, "1.0")
+    loader = ConfigLoader(tmp_path)
+    cache_file = loader.cache_dir / "cache_test.pkl"
+
+    fresh = loader._load_uncached("cache_test")
+    assert cache_file.exists(), "Validated config should be written to the cache"
+
+    # An unchanged source is served from the pickle, even by a new loader
+    assert loader._read_cache(cache_file, loader._source_key(config_file)) is not None
+    cached = ConfigLoader(tmp_path)._load_uncached("cache_test")
+    assert cached.platform == fresh.platform
+    assert cached.interfaces == fresh.interfaces
+
+    # Editing the YAML changes its (mtime, size) key and forces a rebuild
+    _write_platform(tmp_path, "2.0.1")
+    stat = config_file.stat()
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert loader._read_cache(cache_file, loader._source_key(config_file)) is None
+    assert loader._load_uncached("cache_test").platform.version == "2.0.1"
+
+    # A corrupt cache entry is ignored rather than failing the load
+    cache_file.write_bytes(b"not a pickle")
+    assert loader._load_uncached("cache_test").platform.version == "2.0.1"
@@ -0,0 +1,99 @@
+"""
+Test Registry Cache Tests
+
+Exercises the parsed-registry pickle sidecars of the multi-file and split
+registries against throwaway registry directories.
+"""
+
+import os
+
+import yaml
+
+from framework.core.multi_registry import MultiFileRegistryManager
+from framework.core.split_registry import SplitRegistryManager
+from framework.core.test_decorators import auto_configure_test
+
+_GLOBALS = {'defaults': {'platforms': ['all'], 'category': 'regression',
+                         'priority': 'medium', 'requirements_hardware': False}}
+
+
+def _write_yaml(path, data):
+    """Write ``data`` as YAML, making sure the file's mtime moves forward"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    old_mtime = path.stat().st_mtime_ns if path.exists() else 0
+    path.write_text(yaml.safe_dump(data))
+    stat = path.stat()
+    if stat.st_mtime_ns <= old_mtime:
+        os.utime(path, ns=(stat.st_atime_ns, old_mtime + 1_000_000))
+
+
+def _suite(*names):
+    """Suite file contents with one test per name"""
+    return {'suite_info': {'name': 'demo'},
+            'tests': [{'name': name, 'description': f'{name} test'} for name in names]}
+
+
+@auto_configure_test
+def test_multi_registry_cache_round_trip(tmp_path, monkeypatch):
+    """Multi-file registry reloads from its sidecar until a YAML file changes"""
+    monkeypatch.delenv('VORTEX_REGISTRY_NO_CACHE', raising=False)
+    _write_yaml(tmp_path / "_globals.yaml", _GLOBALS)
+    _write_yaml(tmp_path / "demo.yaml", _suite('test_a', 'test_b'))
+
+    first = MultiFileRegistryManager(tmp_path)
+    assert (tmp_path / ".registry_cache.pkl").exists()
+
+    second = MultiFileRegistryManager(tmp_path)
+    assert second._load_registry_cache(second._registry_fingerprint())
+    assert second._registry == first._registry
+    assert [t.name for t in second.get_tests_by_suite('demo')] == ['test_a', 'test_b']
+    assert second.get_test_metadata('test_a').priority == 'medium'
+
+    # Editing a suite file invalidates the cache
+    _write_yaml(tmp_path / "demo.yaml", _suite('test_a', 'test_b', 'test_c'))
+    edited = MultiFileRegistryManager(tmp_path)
+    assert [t.name for t in edited.get_tests_by_suite('demo')] == ['test_a', 'test_b', 'test_c']
+
+    # So does adding a suite file
+    _write_yaml(tmp_path / "extra.yaml", _suite('test_x'))
+    added = MultiFileRegistryManager(tmp_path)
+    assert sorted(added.get_available_suites()) == ['demo', 'extra']
+
+    # A corrupt sidecar is ignored and rewritten
+    (tmp_path / ".registry_cache.pkl").write_bytes(b"not a pickle")
+    recovered = MultiFileRegistryManager(tmp_path)
+    assert recovered._registry == added._registry
+    assert recovered._load_registry_cache(recovered._registry_fingerprint())
+
+
+@auto_configure_test
+def test_split_registry_cache_round_trip(tmp_path, monkeypatch):
+    """Split registry reloads suites and profiles from its sidecar until files change"""
+    monkeypatch.delenv('VORTEX_REGISTRY_NO_CACHE', raising=False)
+    _write_yaml(tmp_path / "_globals.yaml", _GLOBALS)
+    _write_yaml(tmp_path / "suites" / "demo.yaml", _suite('test_a', 'test_b'))
+    profile = {'execution_profile': {'name': 'quick'},
+               'include': [{'suite': 'demo', 'tests': ['test_a'],
+                            'overrides': {'priority': 'critical'}}]}
+    _write_yaml(tmp_path / "execution" / "quick.yaml", profile)
+
+    first = SplitRegistryManager(tmp_path)
+    assert (tmp_path / ".split_registry_cache.pkl").exists()
+
+    second = SplitRegistryManager(tmp_path)
+    assert second._load_registry_cache(second._registry_fingerprint())
+    assert second.get_execution_registry() == first.get_execution_registry()
+    assert second.get_available_execution_profiles() == ['quick']
+    assert list(second.get_execution_registry('quick')) == ['test_a']
+    assert second.get_test_metadata('test_a', 'quick').priority == 'critical'
+
+    # Editing a suite file invalidates the cache
+    _write_yaml(tmp_path / "suites" / "demo.yaml", _suite('test_a', 'test_b', 'test_c'))
+    edited = SplitRegistryManager(tmp_path)
+    assert [t.name for t in edited.get_tests_by_suite('demo')] == ['test_a', 'test_b', 'test_c']
+
+    # So does editing an execution profile
+    profile['include'][0]['tests'].append('test_c')
+    _write_yaml(tmp_path / "execution" / "quick.yaml", profile)
+    reprofiled = SplitRegistryManager(tmp_path)
+    assert list(reprofiled.get_execution_registry('quick')) == ['test_a', 'test_c']
@@ -0,0 +1,75 @@
+"""
+Test Registry Index Tests
+
+Checks the RegistryManager suite/category/priority/platform indexes against
+a plain scan of the registry, using a throwaway legacy registry file.
+"""
+
+import copy
+
+import yaml
+
+from framework.core.test_decorators import auto_configure_test
+from framework.core.test_registry import RegistryManager
+
+
+def _test(name, category, priority, platforms):
+    return {'name': name, 'category': category, 'priority': priority,
+            'description': f'{name} test', 'platforms': platforms}
+
+
+_REGISTRY = {
+    'categories': {'smoke': {'max_duration': '5m'}, 'regression': {}},
+    'priorities': {'critical': {}, 'medium': {}, 'low': {}},
+    'test_suites': {
+        'can_bus': {'tests': [
+            _test('test_can_a', 'smoke', 'critical', ['all']),
+            _test('test_can_b', 'regression', 'medium', ['ecu_platform_a']),
+        ]},
+        'cli_tests': {'tests': [
+            _test('test_cli_a', 'smoke', 'medium', ['mock_platform']),
+            _test('test_cli_b', 'regression', 'low', ['ecu_platform_a', 'mock_platform']),
+        ]},
+    },
+}
+
+
+@auto_configure_test
+def test_registry_manager_indexes(tmp_path):
+    """Indexed registry queries match a linear scan and survive reloads"""
+    registry_file = tmp_path / "test_registry.yaml"
+    config = copy.deepcopy(_REGISTRY)
+    registry_file.write_text(yaml.safe_dump(config))
+    registry = RegistryManager(registry_file)
+    tests = list(registry._registry.values())
+
+    def names(found):
+        return [t.name for t in found]
+
+    for suite in ('can_bus', 'cli_tests', 'missing'):
+        assert names(registry.get_tests_by_suite(suite)) == \
+            [t.name for t in tests if t.suite == suite]
+    for category in ('smoke', 'regression', 'performance'):
+        assert names(registry.get_tests_by_category(category)) == \
+            [t.name for t in tests if t.category == category]
+    for priority in ('critical', 'medium', 'low', 'high'):
+        assert names(registry.get_tests_by_priority(priority)) == \
+            [t.name for t in tests if t.priority == priority]
+    assert names(registry.get_tests_by_platform('mock_platform')) == \
+        ['test_can_a', 'test_cli_a', 'test_cli_b']
+    assert registry.list_available_suites() == ['can_bus', 'cli_tests']
+    assert registry.get_test_metadata('test_can_a').max_duration == '5m'
+
+    # Results are copies; changing one must not corrupt the index
+    registry.get_tests_by_suite('can_bus').clear()
+    registry.get_tests_by_platform('mock_platform').clear()
+    assert len(registry.get_tests_by_suite('can_bus')) == 2
+    assert len(registry.get_tests_by_platform('mock_platform')) == 3
+
+    # Reloading rebuilds every index, including the lazy platform one
+    config['test_suites']['cli_tests']['tests'].append(
+        _test('test_cli_c', 'smoke', 'critical', ['mock_platform']))
+    registry_file.write_text(yaml.safe_dump(config))
+    registry.load_registry()
+    assert names(registry.get_tests_by_priority('critical')) == ['test_can_a', 'test_cli_c']
+    assert 'test_cli_c' in names(registry.get_tests_by_platform('mock_platform'))
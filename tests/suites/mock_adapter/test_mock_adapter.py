@@ -14,7 +14,7 @@ def test_mock_adapter_can_loopback(can_interface):
 
     # Loopback test - receive the message
     arb_id_expected = arb_id + 8 # loopback increments arb_id by 8
-    rx_expected_msg = [2, 3, 4, 46, 68] # loopback increments the data
+    rx_expected_msg = bytes([2, 3, 4, 46, 68]) # loopback increments the data
     rx_msg = can_interface.receive_message()
     assert rx_msg is not None
     assert rx_expected_msg == rx_msg.data
@@ -35,3 +35,55 @@ def test_mock_adapter_serial_loopback(serial_interface):
     rx_data = serial_interface.read(len(tx_data))
     assert rx_data is not None
     assert rx_data == tx_data
+
+@auto_configure_test
+def test_mock_adapter_can_batch_send(can_interface):
+    # Init the mock can adapter
+    result = can_interface.initialize()
+    assert result.success
+
+    # Send a batch of CAN messages
+    batch = [(0x100, [1, 2], False), (0x200, [3, 4], False)]
+    result = can_interface.send_messages(batch)
+    assert result.success
+    assert result.data == len(batch)
+
+    # Loopback test - responses arrive in send order
+    for arb_id, data, _ in batch:
+        rx_msg = can_interface.receive_message(timeout=0)
+        assert rx_msg is not None
+        assert rx_msg.arbitration_id == arb_id + 8
+        assert rx_msg.data == bytes(d + 1 for d in data)
+
+@auto_configure_test
+def test_mock_adapter_gpio_batch_set(gpio_interface):
+    # Init the mock gpio adapter
+    result = gpio_interface.initialize()
+    assert result.success
+
+    # Set several pins in one call
+    updates = {1: True, 2: False, 3: True}
+    result = gpio_interface.set_pins(updates)
+    assert result.success
+    assert result.data == len(updates)
+
+    # Read back every pin
+    for pin, value in updates.items():
+        assert gpio_interface.get_pin(pin) == value
+
+@auto_configure_test
+def test_mock_adapter_gpio_pin_range(gpio_interface):
+    # Init the mock gpio adapter
+    result = gpio_interface.initialize()
+    assert result.success
+
+    # Pins outside 0..pin_count-1 are rejected, not wrapped or allocated
+    for pin in (-1, 1 << 20):
+        assert not gpio_interface.set_pin(pin, True).success
+        assert not gpio_interface.toggle_pin(pin).success
+    result = gpio_interface.set_pins({1: True, -2: True})
+    assert not result.success
+    assert "-2" in result.error
+
+    # A rejected batch leaves every pin untouched
+    assert gpio_interface.get_pin(1) is False
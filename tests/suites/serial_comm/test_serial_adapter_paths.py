@@ -0,0 +1,34 @@
+"""
+Serial Adapter Code Path Tests
+
+Exercises SerialAdapter read paths against the conftest fake port, so they
+run without a UART or pty.
+"""
+
+from framework.core.test_decorators import auto_configure_test
+
+
+@auto_configure_test
+def test_serial_read_into_reuses_buffer(fake_serial_port, fake_serial_adapter):
+    """read_into returns views over one reusable buffer, growing it on demand"""
+    fake_serial_port.rx.extend(b'0123456789abcdef')
+    adapter = fake_serial_adapter(rx_buffer_size=8)
+
+    first = adapter.read_into(4)
+    assert bytes(first) == b'0123'
+    kept = bytes(first)
+
+    second = adapter.read_into(4)
+    assert bytes(second) == b'4567'
+    assert first.obj is second.obj, "Reads should share the adapter buffer"
+    assert bytes(first) == b'4567' and kept == b'0123'
+
+    # Larger than the buffer: grows it, returns only what was read
+    third = adapter.read_into(32)
+    assert bytes(third) == b'89abcdef'
+    assert len(third.obj) >= 32
+
+    assert len(adapter.read_into(4)) == 0
+
+    adapter.cleanup()
+    assert adapter.read_into(4) is None, "read_into needs an open port"
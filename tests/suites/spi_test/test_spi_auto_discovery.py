@@ -27,7 +27,7 @@ def test_spi_auto_discovery(spi_interface):
     assert result.data is not None, "No response data from SPI transfer"
 
     # Verify mock behavior (inverts bytes: 0x01 -> 0xFE, etc.)
-    expected = [0xFE, 0xFD, 0xFC, 0xFB]  # 0xFF - original values
+    expected = bytes([0xFE, 0xFD, 0xFC, 0xFB])  # 0xFF - original values
     assert result.data == expected, f"Expected {expected}, got {result.data}"
 
     print(f"✅ SPI auto-discovery test passed! Sent: {test_data}, Received: {result.data}")